@@ -0,0 +1,136 @@
+# analyzer.py
+import pandas as pd
+from dataclasses import dataclass
+
+from data_loader import GRID, split_list_column
+
+# Kolom jadwal yang diperiksa bentrok, beserta label jenis konfliknya
+RESOURCES = {"ruangan": "Ruangan", "dosen": "Dosen", "kelas": "Kelas"}
+
+@dataclass
+class ScheduleReport:
+    rows: pd.DataFrame          # jadwal + flag pelanggaran/preferensi per baris
+    clashes: pd.DataFrame       # satu baris per mata kuliah yang bentrok, dikelompokkan per slot
+    utilization: pd.DataFrame   # ruangan x (hari, sesi): jumlah mata kuliah
+    room_usage: pd.DataFrame    # ruangan: slot terpakai, slot tersedia, persentase
+    penalty: int
+    bonus: int
+
+    @property
+    def score(self):
+        # Sama dengan AIScheduler.fitness
+        return max(1000 + self.bonus - self.penalty, 0)
+
+    @property
+    def capacity_violations(self):
+        return self.rows[self.rows["melebihi_kapasitas"]]
+
+    @property
+    def unavailable(self):
+        return self.rows[self.rows["ruangan_tidak_tersedia"]]
+
+    @property
+    def feasible(self):
+        return self.clashes.empty and not self.rows["melebihi_kapasitas"].any() \
+            and not self.rows["ruangan_tidak_tersedia"].any()
+
+    def summary(self):
+        n = max(len(self.rows), 1)
+        return {
+            "skor": self.score,
+            "konflik": int(self.rows[[f"konflik_{c}" for c in RESOURCES]].any(axis=1).sum()),
+            "melebihi_kapasitas": int(self.rows["melebihi_kapasitas"].sum()),
+            "ruangan_tidak_tersedia": int(self.rows["ruangan_tidak_tersedia"].sum()),
+            "preferensi_hari": self.rows["preferensi_hari"].sum() / n,
+            "preferensi_sesi": self.rows["preferensi_sesi"].sum() / n,
+        }
+
+def _lookup(codes, df, key, col):
+    # Nilai numerik per baris lewat kategori; kunci duplikat: ambil baris terakhir seperti to_dict("index")
+    df = df.drop_duplicates(key, keep="last")
+    values = pd.to_numeric(pd.Series(df[col].values, index=df[key].astype(str)), errors="coerce")
+    return values.reindex(codes.cat.categories).to_numpy(dtype=float)[codes.cat.codes.to_numpy()]
+
+def _items(df, key, col, numeric=False):
+    # Daftar dipisah koma -> Series item dengan index kode (dosen/ruangan)
+    items = split_list_column(pd.Series(df[col].values, index=df[key].astype(str)))
+    if numeric:
+        items = pd.to_numeric(items, errors="coerce").dropna().astype(int)
+    return items
+
+def _pairs(df, key, col, numeric=False):
+    items = _items(df, key, col, numeric)
+    return pd.MultiIndex.from_arrays([items.index, items.values])
+
+def _match(codes, values, pairs):
+    return pd.MultiIndex.from_arrays([codes, values]).isin(pairs)
+
+def analyze_schedule(jadwal, dosen, kelas, ruangan, hari=None, sesi=None):
+    """Periksa jadwal jadi (mis. jadwal_kuliah.csv) tanpa menjalankan ulang scheduler.
+
+    Semua pemeriksaan memakai operasi vektor (duplicated, map, MultiIndex.isin), sehingga
+    jadwal besar tetap dianalisis dalam waktu singkat. Bentrok dihitung per jenis sumber daya,
+    skor mengikuti bobot AIScheduler.fitness. Tanpa `hari`/`sesi`, grid aplikasi (GRID) dipakai.
+    """
+    hari = hari or list(GRID.hari)
+    sesi = sesi or GRID.sesi
+    df = jadwal[["hari", "sesi", "kode_matkul", "nama_matkul", "kelas", "dosen", "ruangan"]].copy()
+    # Kode diubah ke kategori sekali saja; duplicated/groupby/isin selanjutnya bekerja pada kode integer
+    for col in ["hari", "kelas", "dosen", "ruangan"]:
+        df[col] = df[col].astype(str).astype("category")
+    df["sesi"] = pd.to_numeric(df["sesi"], errors="coerce").astype("Int64")
+
+    penalty = 0
+    clashes = []
+    for col, label in RESOURCES.items():
+        keys = ["hari", "sesi", col]
+        dup = df.duplicated(keys, keep=False)
+        df[f"konflik_{col}"] = dup
+        # Kemunculan pertama di slot dianggap sah, sisanya kena penalti (seperti fitness)
+        penalty += 100 * int(df.duplicated(keys).sum())
+        if dup.any():
+            part = df.loc[dup, keys + ["kode_matkul", "nama_matkul"]].rename(columns={col: "kode"})
+            part.insert(0, "jenis", label)
+            part["jumlah"] = part.groupby(["hari", "sesi", "kode"], observed=True)["kode_matkul"].transform("size")
+            clashes.append(part)
+    clash_cols = ["jenis", "hari", "sesi", "kode", "kode_matkul", "nama_matkul", "jumlah"]
+    clashes = pd.concat(clashes, ignore_index=True) if clashes else pd.DataFrame(columns=clash_cols)
+    clashes = clashes[clash_cols].sort_values(["jenis", "hari", "sesi", "kode"], ignore_index=True)
+
+    df["jumlah_mahasiswa"] = _lookup(df["kelas"], kelas, "kode_kelas", "jumlah_mahasiswa")
+    df["kapasitas"] = _lookup(df["ruangan"], ruangan, "kode_ruang", "kapasitas")
+    df["melebihi_kapasitas"] = df["jumlah_mahasiswa"] > df["kapasitas"]
+
+    room_hari = _match(df["ruangan"], df["hari"], _pairs(ruangan, "kode_ruang", "tersedia_hari"))
+    room_sesi = _match(df["ruangan"], df["sesi"], _pairs(ruangan, "kode_ruang", "tersedia_sesi", numeric=True))
+    df["ruangan_tidak_tersedia"] = ~(room_hari & room_sesi)
+    penalty += 10 * int((~room_hari).sum() + (~room_sesi).sum())
+
+    df["preferensi_hari"] = _match(df["dosen"], df["hari"], _pairs(dosen, "kode_dosen", "preferensi_hari"))
+    df["preferensi_sesi"] = _match(df["dosen"], df["sesi"], _pairs(dosen, "kode_dosen", "preferensi_sesi", numeric=True))
+    bonus = 5 * int(df["preferensi_hari"].sum() + df["preferensi_sesi"].sum())
+
+    # Baris: semua ruangan di ruangan.csv (termasuk yang tidak terpakai sama sekali), lalu ruangan
+    # di jadwal yang tidak terdaftar; kolom: grid hari x sesi plus nilai di luar grid
+    room_codes = ruangan["kode_ruang"].astype(str).drop_duplicates()
+    rooms = list(room_codes) + sorted(set(df["ruangan"]) - set(room_codes))
+    days = list(hari) + sorted(set(df["hari"]) - set(hari))
+    sessions = list(sesi) + sorted(set(df["sesi"].dropna()) - set(sesi))
+    utilization = df.groupby(["ruangan", "hari", "sesi"], observed=True).size().unstack(["hari", "sesi"]) \
+        .reindex(index=pd.Index(rooms, name="ruangan"),
+                 columns=pd.MultiIndex.from_product([days, sessions], names=["hari", "sesi"])) \
+        .fillna(0).astype(int)
+
+    avail_hari = _items(ruangan, "kode_ruang", "tersedia_hari")
+    n_hari = avail_hari[avail_hari.isin(hari)].groupby(level=0).nunique()
+    # Hanya hari/sesi di dalam grid yang dihitung sebagai slot tersedia
+    avail_sesi = _items(ruangan, "kode_ruang", "tersedia_sesi", numeric=True)
+    n_sesi = avail_sesi[avail_sesi.isin(sesi)].groupby(level=0).nunique()
+    room_usage = pd.DataFrame(index=pd.Index(room_codes, name="ruangan"))
+    room_usage["terpakai"] = df.drop_duplicates(["hari", "sesi", "ruangan"])["ruangan"].value_counts() \
+        .reindex(room_usage.index, fill_value=0)
+    room_usage["tersedia"] = (n_hari * n_sesi).reindex(room_usage.index).fillna(0).astype(int)
+    room_usage["persen"] = (100 * room_usage["terpakai"] / room_usage["tersedia"].where(room_usage["tersedia"] > 0)) \
+        .round(1)
+
+    return ScheduleReport(df, clashes, utilization, room_usage, penalty, bonus)
@@ -0,0 +1,59 @@
+# checkpoint.py
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+CHECKPOINT_VERSION = 2
+
+@dataclass
+class Checkpoint:
+    generation: int           # jumlah generasi yang sudah selesai
+    genomes: np.ndarray       # [populasi, n_matkul, 4] int32
+    fitness: np.ndarray       # [populasi]
+    best_genome: np.ndarray   # [n_matkul, 4]
+    best_fitness: float
+    rng_state: tuple          # random.getstate()
+    fingerprint: str
+    params: dict              # parameter GA yang menentukan jalannya run (lihat AIScheduler.RESUME_PARAMS)
+
+def save_checkpoint(path, ckpt: Checkpoint):
+    # Ditulis ke file sementara lalu os.replace, sehingga crash saat menulis tidak merusak checkpoint lama
+    path = Path(path)
+    version, internal, gauss = ckpt.rng_state
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        np.savez_compressed(
+            f,
+            format_version=CHECKPOINT_VERSION,
+            generation=ckpt.generation,
+            genomes=ckpt.genomes,
+            fitness=ckpt.fitness,
+            best_genome=ckpt.best_genome,
+            best_fitness=ckpt.best_fitness,
+            rng_version=version,
+            rng_internal=np.array(internal, dtype=np.int64),
+            rng_gauss=np.nan if gauss is None else gauss,
+            fingerprint=ckpt.fingerprint,
+            params=json.dumps(ckpt.params, sort_keys=True),
+        )
+    os.replace(tmp, path)
+
+def load_checkpoint(path) -> Checkpoint:
+    with np.load(path, allow_pickle=False) as data:
+        if int(data["format_version"]) != CHECKPOINT_VERSION:
+            raise ValueError(f"Versi checkpoint {int(data['format_version'])} tidak didukung")
+        gauss = float(data["rng_gauss"])
+        return Checkpoint(
+            generation=int(data["generation"]),
+            genomes=data["genomes"],
+            fitness=data["fitness"],
+            best_genome=data["best_genome"],
+            best_fitness=float(data["best_fitness"]),
+            rng_state=(int(data["rng_version"]), tuple(data["rng_internal"].tolist()),
+                       None if np.isnan(gauss) else gauss),
+            fingerprint=str(data["fingerprint"]),
+            params=json.loads(str(data["params"])),
+        )
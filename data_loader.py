@@ -1,8 +1,85 @@
 # data_loader.py
+import os
+import numpy as np
 import pandas as pd
+from collections import defaultdict
+from dataclasses import dataclass, field
 from pathlib import Path
 
 DATA_DIR = Path("data")
+DATA_FILES = ["matkul.csv", "dosen.csv", "kelas.csv", "ruangan.csv"]
+
+# === GRID WAKTU ===
+# Urutan hari dalam seminggu (indeks = datetime.weekday()), dipakai untuk tanggal di ekspor
+NAMA_HARI = ["Senin", "Selasa", "Rabu", "Kamis", "Jumat", "Sabtu", "Minggu"]
+
+@dataclass(frozen=True)
+class TimeGrid:
+    """Hari kuliah dan jam (mulai, selesai) tiap sesi; sesi bernomor 1..len(jam).
+
+    Satu grid dipakai bersama oleh validasi upload, scheduler, analyzer dan ekspor.
+    """
+    hari: tuple = ("Senin", "Selasa", "Rabu", "Kamis", "Jumat")
+    jam: tuple = (("07:30", "09:10"), ("09:20", "11:00"), ("11:10", "12:50"),
+                  ("13:30", "15:10"), ("15:20", "17:00"))
+
+    def __post_init__(self):
+        unknown = [h for h in self.hari if h not in NAMA_HARI]
+        if unknown or not self.hari or not self.jam:
+            raise ValueError(f"Grid tidak valid: hari harus dari {', '.join(NAMA_HARI)} "
+                             f"dan minimal satu sesi (hari tidak dikenal: {', '.join(unknown) or '-'})")
+
+    @property
+    def sesi(self):
+        return list(range(1, len(self.jam) + 1))
+
+    @property
+    def sesi_jam(self):
+        return dict(zip(self.sesi, self.jam))
+
+# Grid yang dipakai aplikasi; ubah di sini untuk menambah hari (mis. "Sabtu") atau sesi
+GRID = TimeGrid()
+
+# === SKEMA INPUT ===
+# dtypes: tipe kolom setelah dibaca, required: kolom yang tidak boleh kosong,
+# hari/sesi: kolom daftar dipisah koma yang harus berisi nama hari / nomor sesi
+SCHEMA = {
+    "matkul.csv": {
+        "key": "kode_matkul",
+        "dtypes": {"kode_matkul": "string", "nama_matkul": "string", "sks": "Int64",
+                   "kelas": "string", "dosen": "string"},
+        "required": ["kode_matkul", "nama_matkul", "sks", "kelas", "dosen"],
+    },
+    "dosen.csv": {
+        "key": "kode_dosen",
+        "dtypes": {"kode_dosen": "string", "nama_dosen": "string",
+                   "preferensi_hari": "string", "preferensi_sesi": "string"},
+        "required": ["kode_dosen", "nama_dosen"],
+        "hari": ["preferensi_hari"],
+        "sesi": ["preferensi_sesi"],
+    },
+    "kelas.csv": {
+        "key": "kode_kelas",
+        "dtypes": {"kode_kelas": "string", "jumlah_mahasiswa": "Int64"},
+        "required": ["kode_kelas", "jumlah_mahasiswa"],
+    },
+    "ruangan.csv": {
+        "key": "kode_ruang",
+        "dtypes": {"kode_ruang": "string", "kapasitas": "Int64",
+                   "tersedia_hari": "string", "tersedia_sesi": "string"},
+        "required": ["kode_ruang", "kapasitas"],
+        "hari": ["tersedia_hari"],
+        "sesi": ["tersedia_sesi"],
+    },
+}
+
+# Relasi antar file: (file, kolom) harus merujuk ke kunci file referensi
+REFERENCES = [
+    ("matkul.csv", "dosen", "dosen.csv"),
+    ("matkul.csv", "kelas", "kelas.csv"),
+]
+
+MAX_SAMPLE = 10
 
 def load_csv(file_name):
     path = DATA_DIR / file_name
@@ -10,6 +87,14 @@ def load_csv(file_name):
         raise FileNotFoundError(f"{file_name} tidak ditemukan di folder data/")
     return pd.read_csv(path)
 
+# Tanda tangan file (mtime + ukuran) untuk kunci cache; berubah setiap file ditulis ulang
+def file_signature(file_name):
+    stat = (DATA_DIR / file_name).stat()
+    return (file_name, stat.st_mtime_ns, stat.st_size)
+
+def data_signature():
+    return tuple(file_signature(f) for f in DATA_FILES)
+
 def load_all_data():
     matkul = load_csv("matkul.csv")
     dosen = load_csv("dosen.csv")
@@ -17,6 +102,150 @@ def load_all_data():
     ruangan = load_csv("ruangan.csv")
     return matkul, dosen, kelas, ruangan
 
+def split_list_column(series):
+    # "Senin, Selasa" -> satu baris per item (index asal dipertahankan), item kosong dibuang
+    items = series.dropna().astype(str).str.split(",").explode().str.strip()
+    return items[items != ""]
+
+# === INGEST UPLOAD ===
+@dataclass
+class IngestResult:
+    file_name: str
+    rows: int = 0
+    preview: pd.DataFrame = None
+    errors: list = field(default_factory=list)
+    warnings: list = field(default_factory=list)
+
+    @property
+    def ok(self):
+        return not self.errors
+
+def _format_sample(values, total):
+    sample = ", ".join(str(v) for v in values[:MAX_SAMPLE])
+    return sample + (", ..." if total > MAX_SAMPLE else "")
+
+def _check_chunk(chunk, schema, offset, problems, grid):
+    # Semua pemeriksaan per chunk bersifat vektor; nomor baris dicatat sesuai baris di file CSV
+    def report(message, mask):
+        lines = np.flatnonzero(np.asarray(mask, dtype=bool)) + offset + 2
+        if len(lines):
+            problems[message][0].extend(lines[:MAX_SAMPLE].tolist())
+            problems[message][1] += len(lines)
+
+    for col in schema["required"]:
+        report(f"kolom {col} kosong", chunk[col].isna() | (chunk[col].str.strip() == ""))
+
+    for col, dtype in schema["dtypes"].items():
+        if dtype != "Int64":
+            continue
+        raw = chunk[col]
+        num = pd.to_numeric(raw, errors="coerce")
+        bad = raw.notna() & (num.isna() | (num % 1 != 0) | (num < 1))
+        report(f"kolom {col} harus bilangan bulat positif", bad)
+        chunk[col] = num.where(~bad).astype("Int64")
+
+    for col in schema.get("hari", []):
+        items = split_list_column(chunk[col])
+        bad = items[~items.isin(grid.hari)]
+        report(f"kolom {col} berisi hari tidak dikenal (gunakan {', '.join(grid.hari)} dipisah koma)",
+               chunk.index.isin(bad.index))
+
+    for col in schema.get("sesi", []):
+        items = split_list_column(chunk[col])
+        num = pd.to_numeric(items, errors="coerce")
+        bad = items[~num.isin(grid.sesi)]
+        report(f"kolom {col} berisi sesi tidak dikenal (gunakan {grid.sesi[0]}-{grid.sesi[-1]} dipisah koma)",
+               chunk.index.isin(bad.index))
+    return chunk
+
+def _read_keys(file_name, col):
+    return pd.read_csv(DATA_DIR / file_name, usecols=[col], dtype="string")[col].dropna()
+
+def _check_references(file_name, keys, ref_values, errors, warnings):
+    # Relasi dicek terhadap file yang sudah ada di data/. Upload matkul dengan kode dosen/kelas
+    # yang belum ada ditolak; upload dosen/kelas yang tidak lagi memuat kode yang dipakai matkul
+    # hanya diperingatkan, agar data dengan kode baru bisa diganti berurutan (dosen/kelas dulu,
+    # lalu matkul).
+    for src, col, ref in REFERENCES:
+        ref_key = SCHEMA[ref]["key"]
+        if file_name == src and (DATA_DIR / ref).exists():
+            used, known = pd.Index(ref_values[col]).unique(), _read_keys(ref, ref_key)
+        elif file_name == ref and (DATA_DIR / src).exists():
+            used, known = pd.Index(_read_keys(src, col)).unique(), keys
+        else:
+            continue
+        missing = used.difference(pd.Index(known.unique()))
+        if not len(missing):
+            continue
+        sample = _format_sample(missing.sort_values().tolist(), len(missing))
+        if file_name == src:
+            errors.append(f"{len(missing)} kode {col} di {src} tidak ditemukan di {ref}: {sample}. "
+                          f"Jika memakai kode baru, unggah {ref} yang baru terlebih dahulu.")
+        else:
+            warnings.append(f"{len(missing)} kode {col} yang dipakai {src} saat ini tidak ada di {ref} "
+                            f"yang baru: {sample}. Unggah {src} yang sesuai sebelum membuat jadwal.")
+
+def ingest_csv(source, file_name, chunksize=100_000, grid=GRID):
+    """Baca upload per chunk, validasi skema/kunci/relasi, lalu tulis ke data/ hanya jika valid.
+
+    Hanya kolom kunci dan kolom relasi yang disimpan di memori; isi file langsung ditulis
+    ke file sementara lalu dipindahkan secara atomik. Semua kesalahan dilaporkan sekaligus.
+
+    Relasi yang hanya rusak di sisi file lama (mis. matkul.csv lama memakai kode dosen yang
+    tidak ada di dosen.csv baru) dilaporkan di `warnings` dan tidak menolak upload.
+    Kolom hari/sesi divalidasi terhadap `grid`.
+    """
+    schema = SCHEMA[file_name]
+    key = schema["key"]
+    result = IngestResult(file_name)
+    problems = defaultdict(lambda: [[], 0])
+    keys = []
+    ref_values = {col: [] for src, col, _ in REFERENCES if src == file_name}
+    tmp_path = DATA_DIR / f".{file_name}.tmp"
+
+    try:
+        with open(tmp_path, "w", newline="", encoding="utf-8") as out:
+            for i, chunk in enumerate(pd.read_csv(source, dtype="string", chunksize=chunksize)):
+                if i == 0:
+                    missing = [c for c in schema["dtypes"] if c not in chunk.columns]
+                    if missing:
+                        result.errors.append(f"kolom wajib tidak ada: {', '.join(missing)}")
+                        break
+                chunk = _check_chunk(chunk, schema, result.rows, problems, grid)
+                keys.append(chunk[key])
+                for col in ref_values:
+                    ref_values[col].append(chunk[col].dropna().unique())
+                chunk.to_csv(out, header=(i == 0), index=False)
+                if result.preview is None:
+                    result.preview = chunk.head()
+                result.rows += len(chunk)
+    except ValueError as e:
+        # ParserError, EmptyDataError dan UnicodeDecodeError semuanya turunan ValueError
+        result.errors.append(f"file tidak dapat dibaca: {e}")
+
+    if not result.errors and result.rows == 0:
+        result.errors.append("file tidak berisi data")
+
+    if not result.errors:
+        for message, (lines, count) in problems.items():
+            result.errors.append(f"baris {_format_sample(lines, count)}: {message} ({count} baris)")
+
+        all_keys = pd.concat(keys, ignore_index=True)
+        dup = all_keys.duplicated(keep=False) & all_keys.notna()
+        if dup.any():
+            dup_keys = all_keys[dup].unique().tolist()
+            result.errors.append(f"{len(dup_keys)} {key} duplikat: {_format_sample(dup_keys, len(dup_keys))}")
+
+        ref_values = {col: np.concatenate(v) if v else np.array([], dtype=object)
+                      for col, v in ref_values.items()}
+        _check_references(file_name, all_keys.dropna(), ref_values, result.errors, result.warnings)
+
+    if result.errors:
+        tmp_path.unlink(missing_ok=True)
+    else:
+        os.replace(tmp_path, DATA_DIR / file_name)
+    return result
+
 # Fungsi tambahan jika ingin bentuk dictionary
 def convert_to_dict(df, key_col):
     return df.set_index(key_col).to_dict(orient="index")
\ No newline at end of file
@@ -0,0 +1,162 @@
+# evaluator.py
+import hashlib
+import multiprocessing as mp
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Kolom genome: satu baris per gen (mata kuliah), nilai berupa indeks integer
+GENE_COURSE, GENE_HARI, GENE_SESI, GENE_ROOM = range(4)
+
+@dataclass
+class CompiledProblem:
+    """Data penjadwalan dalam bentuk array numpy, siap dibagi ke proses lain tanpa pickle."""
+    hari: list                 # kode hari sesuai indeks (grid hari x sesi)
+    sesi: list                 # nomor sesi sesuai indeks
+    rooms: list                # kode ruangan sesuai indeks
+    dosen: list                # kode dosen sesuai indeks
+    kelas: list                # kode kelas sesuai indeks
+    course_dosen: np.ndarray   # [n_matkul] indeks dosen
+    course_kelas: np.ndarray   # [n_matkul] indeks kelas
+    pref_hari: np.ndarray      # [n_dosen, n_hari] bool
+    pref_sesi: np.ndarray      # [n_dosen, n_sesi] bool
+    avail_hari: np.ndarray     # [n_ruang, n_hari] bool
+    avail_sesi: np.ndarray     # [n_ruang, n_sesi] bool
+    room_capacity: np.ndarray  # [n_ruang] float, NaN jika tidak diisi
+    course_size: np.ndarray    # [n_matkul] float: jumlah mahasiswa kelas mata kuliah
+
+    @classmethod
+    def from_scheduler(cls, ai):
+        # Hari/sesi di preferensi atau ketersediaan yang berada di luar grid diabaikan
+        hari, sesi = list(ai.HARI), list(ai.SESI)
+        rooms = list(ai.ruangan_dict)
+
+        dosen_codes = list(dict.fromkeys(ai.matkul_df["dosen"]))
+        kelas_codes = list(dict.fromkeys(ai.matkul_df["kelas"]))
+        dosen_index = {d: i for i, d in enumerate(dosen_codes)}
+        kelas_index = {k: i for i, k in enumerate(kelas_codes)}
+
+        def membership(codes, lookup, key, values):
+            table = np.zeros((len(codes), len(values)), dtype=bool)
+            position = {v: j for j, v in enumerate(values)}
+            for i, code in enumerate(codes):
+                for v in lookup.get(code, {}).get(key, []):
+                    if v in position:
+                        table[i, position[v]] = True
+            return table
+
+        return cls(
+            hari=hari, sesi=sesi, rooms=rooms, dosen=dosen_codes, kelas=kelas_codes,
+            course_dosen=np.array([dosen_index[d] for d in ai.matkul_df["dosen"]], dtype=np.int32),
+            course_kelas=np.array([kelas_index[k] for k in ai.matkul_df["kelas"]], dtype=np.int32),
+            pref_hari=membership(dosen_codes, ai.dosen_dict, "preferensi_hari_list", hari),
+            pref_sesi=membership(dosen_codes, ai.dosen_dict, "preferensi_sesi_list", sesi),
+            avail_hari=membership(rooms, ai.ruangan_dict, "tersedia_hari_list", hari),
+            avail_sesi=membership(rooms, ai.ruangan_dict, "tersedia_sesi_list", sesi),
+            room_capacity=np.array([ai.ruangan_dict[r].get("kapasitas", 0) for r in rooms], dtype=float),
+            course_size=np.array([ai.kelas_dict.get(k, {}).get("jumlah_mahasiswa", 0) for k in ai.matkul_df["kelas"]],
+                                 dtype=float),
+        )
+
+    def arrays(self):
+        return {name: getattr(self, name) for name in
+                ["course_dosen", "course_kelas", "pref_hari", "pref_sesi", "avail_hari", "avail_sesi"]}
+
+    def fingerprint(self):
+        # Sidik jari data masalah; checkpoint hanya boleh dilanjutkan pada data yang sama
+        digest = hashlib.sha1(repr((self.hari, self.sesi, self.rooms)).encode())
+        for arr in [*self.arrays().values(), self.room_capacity, self.course_size]:
+            digest.update(np.ascontiguousarray(arr).tobytes())
+            digest.update(repr(arr.shape).encode())
+        return digest.hexdigest()
+
+def _duplicates(keys):
+    # Jumlah kemunculan kedua dan seterusnya per baris: sama dengan hitungan "sudah ada di used"
+    keys = np.sort(keys, axis=1)
+    return (keys[:, 1:] == keys[:, :-1]).sum(axis=1)
+
+def score_genomes(genomes, arrays):
+    """Fitness untuk banyak individu sekaligus; bobot sama dengan AIScheduler.fitness."""
+    c = genomes[..., GENE_COURSE]
+    h = genomes[..., GENE_HARI].astype(np.int64)
+    s = genomes[..., GENE_SESI].astype(np.int64)
+    r = genomes[..., GENE_ROOM].astype(np.int64)
+    d = arrays["course_dosen"][c].astype(np.int64)
+    k = arrays["course_kelas"][c].astype(np.int64)
+
+    slot = h * arrays["pref_sesi"].shape[1] + s
+    n_rooms = max(arrays["avail_hari"].shape[0], 1)
+    n_dosen = max(arrays["pref_hari"].shape[0], 1)
+    n_kelas = int(arrays["course_kelas"].max(initial=0)) + 1
+    penalty = 100 * (_duplicates(slot * n_rooms + r) + _duplicates(slot * n_dosen + d) + _duplicates(slot * n_kelas + k))
+    penalty += 10 * ((~arrays["avail_hari"][r, h]).sum(axis=1) + (~arrays["avail_sesi"][r, s]).sum(axis=1))
+    bonus = 5 * (arrays["pref_hari"][d, h].sum(axis=1) + arrays["pref_sesi"][d, s].sum(axis=1))
+    return np.maximum(1000 + bonus - penalty, 0).astype(np.float64)
+
+# === PROSES WORKER ===
+_worker = {}
+
+def _init_worker(spec):
+    # Worker pool berbagi resource tracker dengan proses utama, jadi blok cukup dibuka;
+    # unlink tetap tanggung jawab SharedMemoryEvaluator.close di proses utama.
+    for name, (shm_name, shape, dtype) in spec.items():
+        shm = shared_memory.SharedMemory(name=shm_name)
+        _worker[name] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        _worker[f"_{name}_shm"] = shm
+
+def _score_slice(start, stop):
+    _worker["fitness"][start:stop] = score_genomes(_worker["genomes"][start:stop], _worker)
+
+class SharedMemoryEvaluator:
+    """Evaluasi fitness paralel: data masalah dan genome populasi ada di shared memory.
+
+    Data masalah disalin sekali saat dibuat; setiap generasi genome integer populasi
+    langsung ditumpuk ke buffer bersama, lalu worker menilai potongan populasi di tempat
+    dan menulis fitness ke array hasil bersama. Argumen yang dikirim ke worker hanya pasangan indeks (start, stop).
+    """
+
+    def __init__(self, problem, capacity, n_genes, workers):
+        self.capacity = capacity
+        self.workers = workers
+        self._blocks = []
+        self._views = {}
+        spec = {}
+        arrays = dict(problem.arrays())
+        arrays["genomes"] = np.zeros((capacity, n_genes, 4), dtype=np.int32)
+        arrays["fitness"] = np.zeros(capacity, dtype=np.float64)
+        for name, arr in arrays.items():
+            shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+            self._blocks.append(shm)
+            view = np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)
+            view[...] = arr
+            self._views[name] = view
+            spec[name] = (shm.name, arr.shape, arr.dtype.str)
+        self._pool = mp.get_context().Pool(workers, initializer=_init_worker, initargs=(spec,))
+
+    def evaluate(self, genomes):
+        # genomes: daftar array [n_matkul, 4]; langsung ditumpuk ke buffer bersama tanpa salinan antara
+        result = np.empty(len(genomes), dtype=np.float64)
+        for offset in range(0, len(genomes), self.capacity):
+            batch = genomes[offset:offset + self.capacity]
+            n = len(batch)
+            np.stack(batch, out=self._views["genomes"][:n])
+            step = -(-n // self.workers)
+            self._pool.starmap(_score_slice, [(i, min(i + step, n)) for i in range(0, n, step)])
+            result[offset:offset + n] = self._views["fitness"][:n]
+        return result
+
+    def close(self):
+        self._pool.close()
+        self._pool.join()
+        self._views = {}  # view numpy harus dilepas sebelum blok ditutup
+        for shm in self._blocks:
+            shm.close()
+            shm.unlink()
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,163 @@
+# exporter.py
+import re
+import zipfile
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from data_loader import GRID, NAMA_HARI
+
+# Kolom jadwal -> folder di dalam zip
+EXPORT_GROUPS = {"dosen": "dosen", "kelas": "kelas", "ruangan": "ruangan"}
+EXPORT_COLUMNS = ["hari", "sesi", "kode_matkul", "nama_matkul", "kelas", "dosen", "ruangan"]
+
+# Jumlah baris yang dirender sekaligus; memori ekspor tidak bergantung pada ukuran jadwal
+CHUNK_ROWS = 5_000
+# RFC 5545 §3.1: panjang baris maksimum dalam oktet, tanpa CRLF
+ICS_LINE_OCTETS = 75
+
+def _safe_name(code):
+    return re.sub(r"[^\w.-]+", "_", str(code)).strip("_") or "_"
+
+def _entry_names(codes):
+    # Nama file unik per kode; kode yang sama setelah disanitasi (atau hanya beda huruf besar,
+    # yang bertabrakan di filesystem case-insensitive) diberi akhiran _2, _3, ...
+    names, used = [], set()
+    for code in codes:
+        base = name = _safe_name(code)
+        n = 2
+        while name.lower() in used:
+            name = f"{base}_{n}"
+            n += 1
+        used.add(name.lower())
+        names.append(name)
+    return names
+
+def _csv_lines(df):
+    # Satu baris CSV per jadwal, dibangun dengan operasi string vektor (quoting seperti csv.QUOTE_MINIMAL)
+    lines = None
+    for col in df.columns:
+        text = df[col].fillna("").astype(str)
+        quoted = text.str.contains(r'[",\r\n]', regex=True)
+        text = text.where(~quoted, '"' + text.str.replace('"', '""', regex=False) + '"')
+        lines = text if lines is None else lines + "," + text
+    return (lines + "\r\n").to_numpy()
+
+def _ics_text(series):
+    # Escape teks iCalendar (RFC 5545): backslash, koma, titik koma, baris baru
+    return series.astype(str).str.replace("\\", "\\\\", regex=False) \
+        .str.replace(",", "\\,", regex=False).str.replace(";", "\\;", regex=False) \
+        .str.replace("\n", "\\n", regex=False)
+
+def _fold_line(line):
+    # Lipat baris > 75 oktet: CRLF + spasi, tanpa memotong karakter UTF-8 multi-byte
+    data = line.encode("utf-8")
+    if len(data) <= ICS_LINE_OCTETS:
+        return line
+    parts, start, limit = [], 0, ICS_LINE_OCTETS
+    while len(data) - start > limit:
+        end = start + limit
+        while data[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(data[start:end])
+        start, limit = end, ICS_LINE_OCTETS - 1  # baris lanjutan diawali satu spasi
+    parts.append(data[start:])
+    return b"\r\n ".join(parts).decode("utf-8")
+
+def _fold(lines):
+    # Hanya baris yang mungkin > 75 oktet yang diproses per baris: > 75 karakter, atau
+    # > 18 karakter dengan huruf non-ASCII (UTF-8 maksimal 4 oktet per karakter)
+    n = lines.str.len()
+    long = (n > ICS_LINE_OCTETS) | ((n > ICS_LINE_OCTETS // 4) & lines.str.contains(r"[^\x00-\x7f]", regex=True))
+    return lines.where(~long, lines[long].map(_fold_line)) + "\r\n"
+
+def _ics_events(df, semester_start, weeks, grid, stamp):
+    # VEVENT untuk satu potongan jadwal, dibangun dengan operasi string vektor; baris dengan
+    # hari/sesi di luar grid menghasilkan string kosong dan dilewati.
+    sesi = pd.to_numeric(df["sesi"], errors="coerce")
+    mulai = sesi.map({s: j[0].replace(":", "") for s, j in grid.sesi_jam.items()})
+    selesai = sesi.map({s: j[1].replace(":", "") for s, j in grid.sesi_jam.items()})
+
+    # Tanggal pertemuan pertama: hari yang sama pada/atau setelah tanggal mulai semester
+    tanggal = df["hari"].map({h: (semester_start + timedelta(
+        days=(NAMA_HARI.index(h) - semester_start.weekday()) % 7)).strftime("%Y%m%d") for h in grid.hari})
+    valid = tanggal.notna() & mulai.notna()
+    # UID dari field yang stabil, sehingga impor ulang memperbarui event yang sama (bukan duplikat)
+    uid = df["kode_matkul"].astype(str) + "-" + df["kelas"].astype(str) + "-" + df["hari"].astype(str) \
+        + "-" + df["sesi"].astype(str)
+    uid = uid.str.replace(r"[^\w.-]+", "_", regex=True)
+
+    events = ("BEGIN:VEVENT\r\n" + _fold("UID:" + uid + "@jadwal-kuliah") + "DTSTAMP:" + stamp
+              + "\r\nDTSTART:" + tanggal.fillna("") + "T" + mulai.fillna("") + "00"
+              + "\r\nDTEND:" + tanggal.fillna("") + "T" + selesai.fillna("") + "00"
+              + f"\r\nRRULE:FREQ=WEEKLY;COUNT={weeks}\r\n"
+              + _fold("SUMMARY:" + _ics_text(df["nama_matkul"]) + " (" + _ics_text(df["kelas"]) + ")")
+              + _fold("LOCATION:" + _ics_text(df["ruangan"]))
+              + _fold("DESCRIPTION:" + _ics_text(df["kode_matkul"]) + " - Dosen " + _ics_text(df["dosen"]))
+              + "END:VEVENT\r\n")
+    return events.where(valid, "").to_numpy()
+
+def _calendar_header(name):
+    return ("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//UASPraktikumAI//Jadwal Kuliah//ID\r\n"
+            + _fold_line(f"X-WR-CALNAME:Jadwal {name}") + "\r\n")
+
+def _entity_order(df, col, grid):
+    # Posisi baris terurut per kode entitas, lalu per hari (urutan grid) dan sesi; kode kosong dilewati
+    codes, uniques = pd.factorize(df[col], sort=True)
+    hari = df["hari"].map({h: i for i, h in enumerate(grid.hari)}).fillna(len(grid.hari)).to_numpy()
+    sesi = pd.to_numeric(df["sesi"], errors="coerce").fillna(np.inf).to_numpy()
+    order = np.lexsort((sesi, hari, codes))
+    return order[codes[order] >= 0], codes, uniques
+
+def _write_entries(zf, df, order, codes, paths, render, header, footer=""):
+    # Satu entri zip per entitas, ditulis lewat zf.open(..., "w") per potongan CHUNK_ROWS baris.
+    # Baris entitas berurutan di `order`, jadi hanya satu entri yang terbuka pada satu waktu.
+    handle, current = None, None
+    for start in range(0, len(order), CHUNK_ROWS):
+        idx = order[start:start + CHUNK_ROWS]
+        text = render(df.iloc[idx][EXPORT_COLUMNS])
+        run_codes = codes[idx]
+        bounds = np.flatnonzero(run_codes[1:] != run_codes[:-1]) + 1
+        for a, b in zip(np.r_[0, bounds], np.r_[bounds, len(idx)]):
+            code = run_codes[a]
+            if code != current:
+                if handle is not None:
+                    handle.write(footer.encode("utf-8"))
+                    handle.close()
+                handle = zf.open(paths[code], "w")
+                handle.write(header(code).encode("utf-8"))
+                current = code
+            handle.write("".join(text[a:b]).encode("utf-8"))
+    if handle is not None:
+        handle.write(footer.encode("utf-8"))
+        handle.close()
+
+def write_bulk_export(jadwal, target, semester_start=None, weeks=16, grid=GRID):
+    """Tulis zip berisi jadwal per dosen, per kelas dan per ruangan (CSV + iCalendar).
+
+    `target` boleh path atau file object (termasuk stream yang tidak bisa di-seek).
+    Baris dikelompokkan dulu per entitas (urutan posisi saja), lalu dirender per potongan
+    CHUNK_ROWS baris dan langsung ditulis ke entri zip yang sedang terbuka, sehingga memori
+    yang dipakai untuk teks ekspor tidak bergantung pada jumlah baris jadwal.
+    Hari, sesi dan jam sesi diambil dari `grid` (harus sama dengan grid penjadwalan).
+    """
+    semester_start = semester_start or date.today()
+    df = jadwal  # kolom dipilih per potongan, agar tidak ada salinan seluruh jadwal
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    csv_header = ",".join(EXPORT_COLUMNS) + "\r\n"
+
+    def render_ics(part):
+        return _ics_events(part, semester_start, weeks, grid, stamp)
+
+    # compresslevel=1: file teks kecil, kompresi cepat jauh lebih penting daripada rasio
+    with zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        for col, folder in EXPORT_GROUPS.items():
+            order, codes, uniques = _entity_order(df, col, grid)
+            names = _entry_names(uniques)
+            _write_entries(zf, df, order, codes, [f"{folder}/{n}.csv" for n in names],
+                           _csv_lines, lambda code: csv_header)
+            _write_entries(zf, df, order, codes, [f"{folder}/{n}.ics" for n in names],
+                           render_ics, lambda code: _calendar_header(f"{folder} {uniques[code]}"),
+                           "END:VCALENDAR\r\n")
+    return target
@@ -1,10 +1,14 @@
 # main.py
+import os
 import streamlit as st
 import pandas as pd
+import altair as alt
 import time
 from pathlib import Path
-from data_loader import load_all_data
-from scheduler import jadwalkan_ai as jadwalkan
+from data_loader import DATA_FILES, GRID, file_signature, data_signature, ingest_csv
+from scheduler import AIScheduler
+from analyzer import analyze_schedule
+from exporter import write_bulk_export
 import base64
 
 # === KONFIGURASI HALAMAN ===
@@ -23,6 +27,10 @@ OUTPUT_DIR = Path("output")
 OUTPUT_DIR.mkdir(exist_ok=True)
 
 JADWAL_PATH = OUTPUT_DIR / "jadwal_kuliah.csv"
+EXPORT_PATH = OUTPUT_DIR / "jadwal_per_entitas.zip"
+CHECKPOINT_PATH = OUTPUT_DIR / "checkpoint.npz"
+# Batas baris tabel pelanggaran yang dikirim ke browser setiap rerun
+MAX_TABLE_ROWS = 1000
 
 # === SIDEBAR NAVIGATION ===
 st.sidebar.title("📅 Menu Navigasi")
@@ -32,6 +40,7 @@ menu = st.sidebar.selectbox(
 )
 
 # === FUNGSI HELPER ===
+@st.cache_data(show_spinner=False)
 def create_template_download():
     # Buat template dalam bentuk zip
     import zipfile
@@ -67,6 +76,79 @@ def save_dataframe_to_csv(df, filename):
 def file_exists(file_name):
     return (DATA_DIR / file_name).exists()
 
+# === CACHE DATA ===
+# Kunci cache memakai tanda tangan file (mtime + ukuran), sehingga setiap penyimpanan
+# ke data/ otomatis membatalkan entri lama tanpa perlu membersihkan cache secara manual.
+@st.cache_data(show_spinner=False, max_entries=32)
+def _read_data_csv(file_name, signature):
+    return pd.read_csv(DATA_DIR / file_name)
+
+def load_data_csv(file_name):
+    # st.cache_data mengembalikan salinan, jadi aman diubah oleh pemanggil
+    return _read_data_csv(file_name, file_signature(file_name))
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _build_scheduler(signature):
+    matkul, dosen, kelas, ruangan = (load_data_csv(f) for f in DATA_FILES)
+    return AIScheduler(matkul, dosen, kelas, ruangan, hari=GRID.hari, sesi=GRID.sesi)
+
+def get_scheduler(**params):
+    # Objek hasil preprocess dibagi antar sesi; parameter GA dipasang pada salinan dangkal
+    return _build_scheduler(data_signature()).with_params(**params)
+
+def jadwal_signature():
+    stat = JADWAL_PATH.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+# jadwal_kuliah.csv dipakai bersama oleh semua sesi. Tabel, analisis dan unduhan di halaman
+# hasil semuanya dibaca dari file ini dengan kunci tanda tangan yang sama, sehingga jadwal yang
+# ditampilkan selalu sama dengan jadwal yang dianalisis, walaupun sesi lain menulis ulang file.
+@st.cache_data(show_spinner=False, max_entries=4)
+def _read_jadwal(jadwal_sig):
+    return pd.read_csv(JADWAL_PATH)
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _analyze_jadwal(jadwal_sig, signature):
+    # Menganalisis isi file yang menjadi kuncinya, jadi rerun halaman (filter, tab, date input)
+    # tidak menghitung ulang analisis dan tidak ada hasil sesi lain yang tersimpan di kunci ini
+    dosen, kelas, ruangan = (load_data_csv(f) for f in ["dosen.csv", "kelas.csv", "ruangan.csv"])
+    return analyze_schedule(_read_jadwal(jadwal_sig), dosen, kelas, ruangan, hari=list(GRID.hari), sesi=GRID.sesi)
+
+def show_limited(df, **kwargs):
+    if len(df) > MAX_TABLE_ROWS:
+        st.caption(f"Menampilkan {MAX_TABLE_ROWS} dari {len(df)} baris.")
+    st.dataframe(df.head(MAX_TABLE_ROWS), **kwargs)
+
+def utilization_heatmap(utilization):
+    heat = utilization.stack(["hari", "sesi"], future_stack=True).rename("jumlah").reset_index()
+    heat["slot"] = heat["hari"].astype(str) + " " + heat["sesi"].astype(str)
+    slots = [f"{h} {s}" for h, s in utilization.columns]
+    return alt.Chart(heat).mark_rect().encode(
+        x=alt.X("slot:O", sort=slots, title="Hari & Sesi"),
+        y=alt.Y("ruangan:N", title="Ruangan"),
+        color=alt.Color("jumlah:Q", scale=alt.Scale(scheme="orangered"), title="Mata Kuliah"),
+        tooltip=["ruangan", "hari", "sesi", "jumlah"],
+    )
+
+def handle_upload(uploaded_file, file_name):
+    # Streamlit menjalankan ulang skrip pada setiap interaksi; file yang sama tidak di-ingest ulang
+    # agar mtime (kunci cache) tidak berubah tanpa alasan.
+    state_key = f"uploaded_{file_name}"
+    cached = st.session_state.get(state_key)
+    if cached is None or cached[0] != uploaded_file.file_id or (cached[1].ok and not file_exists(file_name)):
+        uploaded_file.seek(0)
+        cached = (uploaded_file.file_id, ingest_csv(uploaded_file, file_name, grid=GRID))
+        st.session_state[state_key] = cached
+    result = cached[1]
+    if result.ok:
+        st.success(f"File {file_name} berhasil diunggah ({result.rows} baris)!")
+        for warning in result.warnings:
+            st.warning(f"⚠️ {warning}")
+        st.dataframe(result.preview)
+    else:
+        st.error(f"❌ File {file_name} ditolak, ditemukan {len(result.errors)} masalah:")
+        st.markdown("\n".join(f"- {e}" for e in result.errors))
+
 def create_dummy_data():
     # Buat data dummy untuk demonstrasi
     matkul = pd.DataFrame({
@@ -168,7 +250,7 @@ elif menu == "📤 Upload Data":
     
     with tab1:
         st.header("📁 Upload File CSV")
-        st.markdown("Silakan upload file CSV untuk masing-masing data:")
+        st.markdown("Silakan upload file CSV untuk masing-masing data. File divalidasi (kolom, kode duplikat, relasi matkul → dosen/kelas) sebelum disimpan:")
         
         template_zip = create_template_download()
         st.download_button(
@@ -183,35 +265,23 @@ elif menu == "📤 Upload Data":
             st.subheader("📘 Data Mata Kuliah")
             matkul_file = st.file_uploader("Upload matkul.csv", type=['csv'], key="matkul_upload")
             if matkul_file:
-                matkul_df = pd.read_csv(matkul_file)
-                matkul_df.to_csv(DATA_DIR / "matkul.csv", index=False)
-                st.success("File matkul.csv berhasil diunggah!")
-                st.dataframe(matkul_df.head())
+                handle_upload(matkul_file, "matkul.csv")
             
             st.subheader("👥 Data Kelas Mahasiswa")
             kelas_file = st.file_uploader("Upload kelas.csv", type=['csv'], key="kelas_upload")
             if kelas_file:
-                kelas_df = pd.read_csv(kelas_file)
-                kelas_df.to_csv(DATA_DIR / "kelas.csv", index=False)
-                st.success("File kelas.csv berhasil diunggah!")
-                st.dataframe(kelas_df.head())
+                handle_upload(kelas_file, "kelas.csv")
 
         with col2:
             st.subheader("👨‍🏫 Data Dosen Pengampu")
             dosen_file = st.file_uploader("Upload dosen.csv", type=['csv'], key="dosen_upload")
             if dosen_file:
-                dosen_df = pd.read_csv(dosen_file)
-                dosen_df.to_csv(DATA_DIR / "dosen.csv", index=False)
-                st.success("File dosen.csv berhasil diunggah!")
-                st.dataframe(dosen_df.head())
+                handle_upload(dosen_file, "dosen.csv")
             
             st.subheader("🏫 Data Ruangan")
             ruangan_file = st.file_uploader("Upload ruangan.csv", type=['csv'], key="ruangan_upload")
             if ruangan_file:
-                ruangan_df = pd.read_csv(ruangan_file)
-                ruangan_df.to_csv(DATA_DIR / "ruangan.csv", index=False)
-                st.success("File ruangan.csv berhasil diunggah!")
-                st.dataframe(ruangan_df.head())
+                handle_upload(ruangan_file, "ruangan.csv")
     
     with tab2:
         st.header("➕ Input Manual")
@@ -237,7 +307,7 @@ elif menu == "📤 Upload Data":
                                              columns=["kode_matkul", "nama_matkul", "sks", "kelas", "dosen"])
                         
                         if file_exists("matkul.csv"):
-                            df = pd.read_csv(DATA_DIR / "matkul.csv")
+                            df = load_data_csv("matkul.csv")
                             df = pd.concat([df, new_row], ignore_index=True)
                         else:
                             df = new_row
@@ -250,8 +320,8 @@ elif menu == "📤 Upload Data":
                 st.subheader("👨‍🏫 Tambah Dosen")
                 kode = st.text_input("Kode Dosen*", placeholder="D001")
                 nama = st.text_input("Nama Dosen*", placeholder="Dr. Ahmad")
-                hari = st.multiselect("Preferensi Hari", ["Senin", "Selasa", "Rabu", "Kamis", "Jumat"], default=["Senin", "Selasa"])
-                sesi = st.multiselect("Preferensi Sesi", [1, 2, 3, 4, 5], default=[1, 2])
+                hari = st.multiselect("Preferensi Hari", list(GRID.hari), default=list(GRID.hari[:2]))
+                sesi = st.multiselect("Preferensi Sesi", GRID.sesi, default=GRID.sesi[:2])
                 
                 submitted = st.form_submit_button("💾 Simpan Dosen")
                 if submitted:
@@ -262,7 +332,7 @@ elif menu == "📤 Upload Data":
                                              columns=["kode_dosen", "nama_dosen", "preferensi_hari", "preferensi_sesi"])
                         
                         if file_exists("dosen.csv"):
-                            df = pd.read_csv(DATA_DIR / "dosen.csv")
+                            df = load_data_csv("dosen.csv")
                             df = pd.concat([df, new_row], ignore_index=True)
                         else:
                             df = new_row
@@ -285,7 +355,7 @@ elif menu == "📤 Upload Data":
                                              columns=["kode_kelas", "jumlah_mahasiswa"])
                         
                         if file_exists("kelas.csv"):
-                            df = pd.read_csv(DATA_DIR / "kelas.csv")
+                            df = load_data_csv("kelas.csv")
                             df = pd.concat([df, new_row], ignore_index=True)
                         else:
                             df = new_row
@@ -298,9 +368,8 @@ elif menu == "📤 Upload Data":
                 st.subheader("🏫 Tambah Ruangan")
                 kode = st.text_input("Kode Ruangan*", placeholder="R101")
                 kapasitas = st.number_input("Kapasitas*", min_value=1, value=50)
-                hari = st.multiselect("Hari Tersedia", ["Senin", "Selasa", "Rabu", "Kamis", "Jumat"], 
-                                    default=["Senin", "Selasa", "Rabu", "Kamis", "Jumat"])
-                sesi = st.multiselect("Sesi Tersedia", [1, 2, 3, 4, 5], default=[1, 2, 3, 4, 5])
+                hari = st.multiselect("Hari Tersedia", list(GRID.hari), default=list(GRID.hari))
+                sesi = st.multiselect("Sesi Tersedia", GRID.sesi, default=GRID.sesi)
                 
                 submitted = st.form_submit_button("💾 Simpan Ruangan")
                 if submitted:
@@ -311,7 +380,7 @@ elif menu == "📤 Upload Data":
                                              columns=["kode_ruang", "kapasitas", "tersedia_hari", "tersedia_sesi"])
                         
                         if file_exists("ruangan.csv"):
-                            df = pd.read_csv(DATA_DIR / "ruangan.csv")
+                            df = load_data_csv("ruangan.csv")
                             df = pd.concat([df, new_row], ignore_index=True)
                         else:
                             df = new_row
@@ -352,7 +421,7 @@ elif menu == "✏️ Edit Data":
     # === TAB MATA KULIAH ===
     with tab_edit[0]:
         if file_exists("matkul.csv"):
-            df = pd.read_csv(DATA_DIR / "matkul.csv")
+            df = load_data_csv("matkul.csv")
             st.subheader("📘 Data Mata Kuliah")
             
             edited_df = st.data_editor(
@@ -377,7 +446,7 @@ elif menu == "✏️ Edit Data":
     # === TAB DOSEN ===
     with tab_edit[1]:
         if file_exists("dosen.csv"):
-            df = pd.read_csv(DATA_DIR / "dosen.csv")
+            df = load_data_csv("dosen.csv")
             df["preferensi_sesi"] = df["preferensi_sesi"].astype(str)
             st.subheader("👨‍🏫 Data Dosen")
             
@@ -402,7 +471,7 @@ elif menu == "✏️ Edit Data":
     # === TAB KELAS ===
     with tab_edit[2]:
         if file_exists("kelas.csv"):
-            df = pd.read_csv(DATA_DIR / "kelas.csv")
+            df = load_data_csv("kelas.csv")
             st.subheader("👥 Data Kelas")
             
             edited_df = st.data_editor(
@@ -424,7 +493,7 @@ elif menu == "✏️ Edit Data":
     # === TAB RUANGAN ===
     with tab_edit[3]:
         if file_exists("ruangan.csv"):
-            df = pd.read_csv(DATA_DIR / "ruangan.csv")
+            df = load_data_csv("ruangan.csv")
             df["tersedia_sesi"] = df["tersedia_sesi"].astype(str)
             st.subheader("🏫 Data Ruangan")
             
@@ -474,12 +543,27 @@ elif menu == "🗓 Generate Jadwal":
         population_size = st.slider("Ukuran Populasi", 50, 500, 100, 50)
         generations = st.slider("Jumlah Generasi", 100, 1000, 300, 50)
         mutation_rate = st.slider("Tingkat Mutasi", 0.01, 0.5, 0.1, 0.01)
+        max_workers = os.cpu_count() or 1
+        workers = st.slider("Jumlah Proses Paralel", 1, max_workers, 1, 1) if max_workers > 1 else 1
+        repair = st.checkbox(
+            "Perbaikan lokal setiap 10 generasi",
+            value=True,
+            help="Memperbaiki bentrok yang tersisa pada individu terbaik. Hasil akhir selalu diperbaiki."
+        )
+        resume = False
+        if CHECKPOINT_PATH.exists():
+            resume = st.checkbox(
+                "Lanjutkan dari checkpoint terakhir",
+                help="Melanjutkan run sebelumnya sampai Jumlah Generasi total. Naikkan Jumlah Generasi untuk melanjutkan run yang sudah selesai."
+            )
         
         st.info("""
         **Penjelasan Parameter:**
         - **Ukuran Populasi**: Jumlah solusi yang dievaluasi setiap generasi
         - **Jumlah Generasi**: Iterasi algoritma genetika
         - **Tingkat Mutasi**: Probabilitas terjadinya mutasi pada kromosom
+        - **Jumlah Proses Paralel**: Jumlah CPU untuk menghitung fitness (bermanfaat untuk data besar)
+        - **Perbaikan Lokal**: Memindah/menukar jadwal yang bentrok agar lebih cepat mencapai jadwal tanpa bentrok
         """)
     
     with col2:
@@ -487,12 +571,18 @@ elif menu == "🗓 Generate Jadwal":
         
         if st.button("🔄 Mulai Generate Jadwal", use_container_width=True, type="primary"):
             try:
-                # Load data
+                # Load data (dari cache selama file di data/ tidak berubah)
                 with st.spinner("📊 Memuat data..."):
-                    matkul, dosen, kelas, ruangan = load_all_data()
+                    ai = get_scheduler(
+                        population_size=population_size,
+                        generations=generations,
+                        mutation_rate=mutation_rate,
+                        workers=workers,
+                        repair_every=10 if repair else 0
+                    )
                 
                 # Validasi data
-                if matkul.empty:
+                if ai.matkul_df.empty:
                     st.error("❌ Data mata kuliah kosong!")
                     st.stop()
                 
@@ -509,26 +599,30 @@ elif menu == "🗓 Generate Jadwal":
                         time.sleep(0.2)
                     
                     # Panggil fungsi penjadwalan
-                    df_jadwal = jadwalkan(
-                        matkul, 
-                        dosen, 
-                        kelas, 
-                        ruangan,
-                        population_size=population_size,
-                        generations=generations,
-                        mutation_rate=mutation_rate
-                    )
+                    best = ai.evolve(checkpoint_path=CHECKPOINT_PATH, resume=resume)
+                    df_jadwal = ai.to_dataframe(best)
+                    violations = ai.violations(best)
                     
                     progress_bar.progress(100)
-                    status_text.text("✅ Jadwal berhasil dibuat!")
+                    status_text.text("✅ Jadwal berhasil dibuat!" if not violations else "⚠️ Jadwal dibuat dengan pelanggaran")
                     time.sleep(1)
                 
                 # Simpan hasil
-                st.session_state["jadwal"] = df_jadwal
-                df_jadwal.to_csv(JADWAL_PATH, index=False)
+                # Tulis ke file sementara lalu ganti secara atomik: sesi lain tidak membaca file setengah jadi
+                tmp_path = JADWAL_PATH.with_name(f".{JADWAL_PATH.name}.tmp")
+                df_jadwal.to_csv(tmp_path, index=False)
+                os.replace(tmp_path, JADWAL_PATH)
+                EXPORT_PATH.unlink(missing_ok=True)
                 
-                st.success(f"✅ Jadwal berhasil dibuat dengan {len(df_jadwal)} mata kuliah terjadwal!")
-                st.balloons()
+                if violations:
+                    st.warning(
+                        f"⚠️ Jadwal belum layak: {violations} mata kuliah masih bentrok atau melanggar "
+                        "kapasitas/ketersediaan ruangan. Periksa detailnya di menu Hasil Jadwal, lalu coba "
+                        "tambah jumlah generasi, lanjutkan dari checkpoint, atau tambah data ruangan."
+                    )
+                else:
+                    st.success(f"✅ Jadwal berhasil dibuat dengan {len(df_jadwal)} mata kuliah terjadwal!")
+                    st.balloons()
                 
                 # Tampilkan preview
                 st.subheader("📋 Preview Jadwal")
@@ -548,12 +642,10 @@ elif menu == "🗓 Generate Jadwal":
 elif menu == "📋 Hasil Jadwal":
     st.title("📋 Hasil Jadwal Kuliah")
     
-    if "jadwal" in st.session_state:
-        df_jadwal = st.session_state["jadwal"]
-    elif JADWAL_PATH.exists():
+    if JADWAL_PATH.exists():
         try:
-            df_jadwal = pd.read_csv(JADWAL_PATH)
-            st.session_state["jadwal"] = df_jadwal
+            jadwal_sig = jadwal_signature()
+            df_jadwal = _read_jadwal(jadwal_sig)
         except:
             st.error("❌ Gagal memuat file jadwal. Format mungkin tidak sesuai.")
             st.stop()
@@ -573,6 +665,43 @@ elif menu == "📋 Hasil Jadwal":
     with col4:
         st.metric("Jumlah Kelas Terjadwal", df_jadwal['kelas'].nunique())
     
+    # Kualitas jadwal: bentrok, kapasitas, ketersediaan ruangan dan preferensi dosen
+    report = None
+    if all(file_exists(f) for f in DATA_FILES):
+        try:
+            report = _analyze_jadwal(jadwal_sig, data_signature())
+        except KeyError as e:
+            st.warning(f"⚠️ Kualitas jadwal tidak dapat dihitung, kolom tidak ditemukan: {e}")
+    
+    if report is not None:
+        st.subheader("✅ Kualitas Jadwal")
+        summary = report.summary()
+        col1, col2, col3, col4, col5 = st.columns(5)
+        with col1:
+            st.metric("Skor", summary["skor"])
+        with col2:
+            st.metric("Mata Kuliah Bentrok", summary["konflik"])
+        with col3:
+            st.metric("Melebihi Kapasitas", summary["melebihi_kapasitas"])
+        with col4:
+            st.metric("Ruangan Tidak Tersedia", summary["ruangan_tidak_tersedia"])
+        with col5:
+            st.metric("Preferensi Dosen", f"{50 * (summary['preferensi_hari'] + summary['preferensi_sesi']):.0f}%")
+        
+        if report.feasible:
+            st.success("Tidak ada bentrok maupun pelanggaran kapasitas/ketersediaan ruangan.")
+        else:
+            if not report.clashes.empty:
+                with st.expander(f"⚠️ Daftar Bentrok ({len(report.clashes)} baris)"):
+                    show_limited(report.clashes, use_container_width=True)
+            if not report.capacity_violations.empty:
+                with st.expander(f"⚠️ Melebihi Kapasitas ({len(report.capacity_violations)})"):
+                    show_limited(report.capacity_violations[["hari", "sesi", "kode_matkul", "kelas", "ruangan",
+                                                             "jumlah_mahasiswa", "kapasitas"]], use_container_width=True)
+            if not report.unavailable.empty:
+                with st.expander(f"⚠️ Ruangan Tidak Tersedia ({len(report.unavailable)})"):
+                    show_limited(report.unavailable[["hari", "sesi", "kode_matkul", "ruangan"]], use_container_width=True)
+    
     # Tampilkan jadwal
     st.subheader("📅 Jadwal Kuliah")
     
@@ -592,7 +721,7 @@ elif menu == "📋 Hasil Jadwal":
     
     # Visualisasi jadwal
     st.subheader("📊 Visualisasi Jadwal")
-    tab1, tab2 = st.tabs(["Per Hari", "Per Ruangan"])
+    tab1, tab2, tab3 = st.tabs(["Per Hari", "Per Ruangan", "Utilisasi Ruangan"])
     
     with tab1:
         hari_pilihan = st.selectbox("Pilih Hari", options=df_jadwal['hari'].unique())
@@ -626,9 +755,21 @@ elif menu == "📋 Hasil Jadwal":
         else:
             st.info(f"Tidak ada jadwal di ruangan {ruangan_pilihan}")
     
+    with tab3:
+        if report is not None:
+            st.markdown("Jumlah mata kuliah per ruangan untuk setiap hari dan sesi (nilai > 1 berarti bentrok):")
+            st.altair_chart(utilization_heatmap(report.utilization), use_container_width=True)
+            st.markdown("Persentase slot tersedia yang terpakai per ruangan:")
+            st.bar_chart(report.room_usage["persen"])
+            st.dataframe(report.room_usage, use_container_width=True)
+        else:
+            st.info("Data master belum lengkap, utilisasi ruangan tidak dapat dihitung.")
+    
     # Ekspor jadwal
     st.subheader("📤 Ekspor Jadwal")
-    csv = df_jadwal.to_csv(index=False).encode('utf-8')
+    # Isi file yang sama dengan tabel di atas: df_jadwal dibaca dari jadwal_kuliah.csv dengan
+    # tanda tangan jadwal_sig, jadi cukup kirim ulang file tersebut jika belum ditulis ulang
+    csv = JADWAL_PATH.read_bytes() if jadwal_signature() == jadwal_sig else df_jadwal.to_csv(index=False).encode('utf-8')
     st.download_button(
         label="⬇️ Download Jadwal (CSV)",
         data=csv,
@@ -636,6 +777,27 @@ elif menu == "📋 Hasil Jadwal":
         mime="text/csv",
         use_container_width=True
     )
+    
+    st.markdown("**Ekspor per Dosen, Kelas & Ruangan** (CSV + kalender iCalendar dalam satu ZIP)")
+    col1, col2 = st.columns(2)
+    with col1:
+        semester_start = st.date_input("Tanggal Mulai Semester")
+    with col2:
+        weeks = st.number_input("Jumlah Pertemuan (minggu)", min_value=1, max_value=30, value=16)
+    
+    if st.button("📦 Siapkan Ekspor per Entitas", use_container_width=True):
+        with st.spinner("📦 Menyusun file ekspor..."):
+            write_bulk_export(df_jadwal, EXPORT_PATH, semester_start, weeks, grid=GRID)
+    
+    if EXPORT_PATH.exists():
+        with open(EXPORT_PATH, "rb") as f:
+            st.download_button(
+                label="⬇️ Download Jadwal per Entitas (ZIP)",
+                data=f,
+                file_name="jadwal_per_entitas.zip",
+                mime="application/zip",
+                use_container_width=True
+            )
 
 # === SIDEBAR FOOTER ===
 st.sidebar.markdown("---")
@@ -661,8 +823,7 @@ if st.sidebar.button("🔄 Reset Aplikasi", use_container_width=True):
         path = DATA_DIR / file
         if path.exists():
             path.unlink()
-    if "jadwal" in st.session_state:
-        del st.session_state["jadwal"]
+    CHECKPOINT_PATH.unlink(missing_ok=True)
     st.sidebar.success("Aplikasi berhasil direset!")
     time.sleep(1)
     st.experimental_set_query_params(menu="🏠 Beranda")
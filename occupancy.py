@@ -0,0 +1,183 @@
+# occupancy.py
+import numpy as np
+
+# Jenis sumber daya yang dicatat di grid
+ROOM, DOSEN, KELAS = range(3)
+
+def iter_bits(mask):
+    # Indeks bit yang menyala, dari yang terkecil
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+class OccupancyGrid:
+    """Hunian slot waktu (hari x sesi) untuk setiap ruang, dosen dan kelas.
+
+    Setiap sumber daya punya bitset integer (bit ke-t menyala = slot t terisi) sehingga
+    irisan "slot kosong untuk dosen ∩ kelas ∩ ruang" cukup beberapa operasi bit. Hitungan
+    per slot disimpan terpisah agar release tetap benar ketika satu slot terisi ganda.
+    Untuk ruang juga disimpan bitset per slot (bit ke-r menyala = ruang r terisi), supaya
+    pencarian ruang kosong di satu slot tidak perlu mengulang semua ruang. Sumber daya
+    diindeks dengan integer, jadi kode dosen yang sama dengan kode ruang/kelas tidak pernah
+    tertukar.
+    """
+
+    def __init__(self, n_slots, n_rooms, n_dosen, n_kelas):
+        self.n_slots = n_slots
+        self.full = (1 << n_slots) - 1
+        self._bits = [[0] * n_rooms, [0] * n_dosen, [0] * n_kelas]
+        self._counts = [[0] * (n_rooms * n_slots), [0] * (n_dosen * n_slots), [0] * (n_kelas * n_slots)]
+        self._rooms_at = [0] * n_slots
+
+    def _add(self, kind, idx, slot, delta):
+        counts = self._counts[kind]
+        i = idx * self.n_slots + slot
+        before = counts[i]
+        counts[i] = before + delta
+        if before == 0 and delta > 0:
+            self._bits[kind][idx] |= 1 << slot
+            if kind == ROOM:
+                self._rooms_at[slot] |= 1 << idx
+        elif before + delta == 0:
+            self._bits[kind][idx] &= ~(1 << slot)
+            if kind == ROOM:
+                self._rooms_at[slot] &= ~(1 << idx)
+        return before
+
+    def occupy(self, slot, room, dosen, kelas):
+        """Isi slot; kembalikan jumlah sumber daya yang sudah terisi sebelumnya (0-3)."""
+        return (self._add(ROOM, room, slot, 1) > 0) + (self._add(DOSEN, dosen, slot, 1) > 0) \
+            + (self._add(KELAS, kelas, slot, 1) > 0)
+
+    def release(self, slot, room, dosen, kelas):
+        self._add(ROOM, room, slot, -1)
+        self._add(DOSEN, dosen, slot, -1)
+        self._add(KELAS, kelas, slot, -1)
+
+    def busy(self, room=None, dosen=None, kelas=None):
+        mask = 0
+        if room is not None:
+            mask |= self._bits[ROOM][room]
+        if dosen is not None:
+            mask |= self._bits[DOSEN][dosen]
+        if kelas is not None:
+            mask |= self._bits[KELAS][kelas]
+        return mask
+
+    def free(self, room=None, dosen=None, kelas=None):
+        return self.full & ~self.busy(room, dosen, kelas)
+
+    def rooms_busy(self, slot):
+        return self._rooms_at[slot]
+
+def _bitset(indices, size):
+    # Indeks -> bitset integer (bit ke-i menyala), lewat packbits agar tidak ada loop Python
+    flags = np.zeros(size, dtype=bool)
+    flags[indices] = True
+    return int.from_bytes(np.packbits(flags, bitorder="little").tobytes(), "little")
+
+def shared_cells(*keys):
+    """Mask gen yang memakai sel yang sama dengan gen lain pada salah satu array kunci.
+
+    Kunci sel = slot * jumlah_sumber_daya + indeks; duplikat dicari dengan pengurutan.
+    """
+    shared = np.zeros(len(keys[0]), dtype=bool)
+    for key in keys:
+        order = np.argsort(key, kind="stable")
+        same = key[order][1:] == key[order][:-1]
+        shared[order[1:][same]] = True
+        shared[order[:-1][same]] = True
+    return shared
+
+class OccupancyView:
+    """Hunian read-only yang dihitung langsung dari array gen, tanpa membangun OccupancyGrid.
+
+    Query-nya sama dengan OccupancyGrid (free, busy, rooms_busy), masing-masing satu operasi
+    vektor atas semua gen. Cocok untuk mutasi yang hanya menanyakan satu dosen/kelas dan
+    beberapa slot. Gen di posisi `skip` dianggap tidak ada (gen yang sedang dipindah).
+    """
+
+    def __init__(self, n_slots, n_rooms, slots, rooms, dosen, kelas, skip=None):
+        self.n_slots = n_slots
+        self.n_rooms = n_rooms
+        self.full = (1 << n_slots) - 1
+        keep = np.ones(len(slots), dtype=bool)
+        if skip is not None:
+            keep[skip] = False
+        self._slots, self._rooms = slots[keep], rooms[keep]
+        self._dosen, self._kelas = dosen[keep], kelas[keep]
+        self._rooms_at = None
+
+    def busy(self, room=None, dosen=None, kelas=None):
+        used = np.zeros(len(self._slots), dtype=bool)
+        if room is not None:
+            used |= self._rooms == room
+        if dosen is not None:
+            used |= self._dosen == dosen
+        if kelas is not None:
+            used |= self._kelas == kelas
+        return _bitset(self._slots[used], self.n_slots)
+
+    def free(self, room=None, dosen=None, kelas=None):
+        return self.full & ~self.busy(room, dosen, kelas)
+
+    def rooms_busy(self, slot):
+        if self._rooms_at is None:
+            # Semua slot sekaligus: matriks slot x ruang lalu packbits per baris
+            flags = np.zeros((self.n_slots, self.n_rooms), dtype=bool)
+            flags[self._slots, self._rooms] = True
+            packed = np.packbits(flags, axis=1, bitorder="little")
+            self._rooms_at = [int.from_bytes(row.tobytes(), "little") for row in packed]
+        return self._rooms_at[slot]
+
+class ConflictIndex:
+    """OccupancyGrid plus pemetaan sel (jenis, sumber daya, slot) -> gen.
+
+    `conflicted` selalu berisi posisi gen yang berbagi ruang, dosen atau kelas dengan gen
+    lain di slot yang sama, dan diperbarui setiap kali gen ditambah atau dipindah.
+    """
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.genes = {}       # posisi gen -> (slot, ruang, dosen, kelas)
+        self._cells = {}      # (jenis, indeks, slot) -> set posisi gen
+        self.conflicted = set()
+
+    @staticmethod
+    def _cells_of(slot, room, dosen, kelas):
+        return (ROOM, room, slot), (DOSEN, dosen, slot), (KELAS, kelas, slot)
+
+    def add(self, pos, slot, room, dosen, kelas):
+        self.grid.occupy(slot, room, dosen, kelas)
+        self.genes[pos] = (slot, room, dosen, kelas)
+        for cell in self._cells_of(slot, room, dosen, kelas):
+            members = self._cells.setdefault(cell, set())
+            members.add(pos)
+            if len(members) > 1:
+                self.conflicted.update(members)
+
+    def remove(self, pos):
+        slot, room, dosen, kelas = gene = self.genes.pop(pos)
+        self.grid.release(*gene)
+        self.conflicted.discard(pos)
+        for cell in self._cells_of(*gene):
+            members = self._cells[cell]
+            members.discard(pos)
+            if len(members) == 1:
+                (other,) = members
+                if not self.in_conflict(other):
+                    self.conflicted.discard(other)
+            elif not members:
+                del self._cells[cell]
+        return gene
+
+    def in_conflict(self, pos):
+        return any(len(self._cells[cell]) > 1 for cell in self._cells_of(*self.genes[pos]))
+
+    def blockers(self, slot, room, dosen, kelas):
+        """Gen yang menempati ruang, dosen atau kelas ini pada slot tersebut."""
+        found = set()
+        for cell in self._cells_of(slot, room, dosen, kelas):
+            found |= self._cells.get(cell, set())
+        return found
@@ -1,17 +1,42 @@
+import copy
 import random
+import numpy as np
 import pandas as pd
-from typing import List, Tuple
+from typing import List
 from dataclasses import dataclass
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+
+from checkpoint import Checkpoint, load_checkpoint, save_checkpoint
+from data_loader import GRID
+from evaluator import (GENE_COURSE, GENE_HARI, GENE_ROOM, GENE_SESI, CompiledProblem, SharedMemoryEvaluator,
+                       score_genomes)
+from occupancy import ConflictIndex, OccupancyGrid, OccupancyView, iter_bits, shared_cells
 
 @dataclass
 class Schedule:
-    assignments: List[Tuple]  # (mata_kuliah_index, hari, sesi, ruangan)
-    fitness: float = 0.0
+    # [n_matkul, 4] int32: (mata_kuliah_index, indeks hari, indeks sesi, indeks ruangan);
+    # baris ke-i selalu mata kuliah ke-i. Decode ke kode hanya lewat to_dataframe.
+    genome: np.ndarray
+    fitness: float = None     # None: belum dinilai
 
 class AIScheduler:
+    GA_PARAMS = ("population_size", "generations", "mutation_rate", "crossover_rate", "elite_size", "workers",
+                 "conflict_bias", "repair_every", "repair_top", "repair_depth")
+    # Parameter yang mengubah jalannya run; resume dari checkpoint hanya jika semuanya sama
+    RESUME_PARAMS = ("population_size", "mutation_rate", "crossover_rate", "elite_size", "conflict_bias",
+                     "repair_every", "repair_top", "repair_depth")
+    # Grid waktu; mengganti salah satunya lewat with_params menyusun ulang indeks slot
+    GRID_PARAMS = ("hari", "sesi")
+    # Jumlah sel alternatif yang dicoba per langkah rantai perbaikan
+    REPAIR_WIDTH = 8
+
     def __init__(self, matkul_df, dosen_df, kelas_df, ruangan_df,
                  population_size=100, generations=300,
-                 mutation_rate=0.1, crossover_rate=0.8, elite_size=10):
+                 mutation_rate=0.1, crossover_rate=0.8, elite_size=10, workers=1,
+                 conflict_bias=0.9, repair_every=10, repair_top=2, repair_depth=3,
+                 hari=None, sesi=None):
         self.matkul_df = matkul_df
         self.dosen_df = dosen_df
         self.kelas_df = kelas_df
@@ -22,12 +47,38 @@ class AIScheduler:
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
         self.elite_size = elite_size
+        self.workers = workers
+        # Peluang mutasi memilih gen yang sedang bentrok (jika ada) alih-alih gen acak
+        self.conflict_bias = conflict_bias
+        # Perbaikan lokal: repair_top individu terbaik setiap repair_every generasi
+        # (0 = hanya hasil akhir), rantai pindah paling dalam repair_depth langkah
+        self.repair_every = repair_every
+        self.repair_top = repair_top
+        self.repair_depth = repair_depth
+        self._evaluator = None
 
-        self.HARI = ["Senin", "Selasa", "Rabu", "Kamis", "Jumat"]
-        self.SESI = [1, 2, 3, 4, 5]
+        # Grid waktu hari x sesi; default grid aplikasi (data_loader.GRID)
+        self.HARI = list(hari) if hari else list(GRID.hari)
+        self.SESI = list(sesi) if sesi else GRID.sesi
 
         self._preprocess()
 
+    def with_params(self, **params):
+        # Salinan dangkal: data hasil _preprocess dipakai bersama, kecuali grid ikut diganti
+        clone = copy.copy(self)
+        regrid = False
+        for name, value in params.items():
+            if name in self.GRID_PARAMS:
+                setattr(clone, name.upper(), list(value))
+                regrid = True
+            elif name in self.GA_PARAMS:
+                setattr(clone, name, value)
+            else:
+                raise AttributeError(f"Parameter tidak dikenal: {name}")
+        if regrid:
+            clone._preprocess()
+        return clone
+
     def _parse_list(self, text):
         if pd.isna(text): return []
         try:
@@ -57,118 +108,365 @@ class AIScheduler:
             info["tersedia_hari_list"] = self._parse_list(info.get("tersedia_hari", ""))
             info["tersedia_sesi_list"] = self._safe_int_list(info.get("tersedia_sesi", ""))
 
-    def _get_valid_slots(self, matkul, used):
-        valid = []
-        d_info = self.dosen_dict.get(matkul['dosen'], {})
-        k_info = self.kelas_dict.get(matkul['kelas'], {})
-        n_mhs = k_info.get('jumlah_mahasiswa', 0)
-        for h in d_info.get('preferensi_hari_list', self.HARI):
-            for s in d_info.get('preferensi_sesi_list', self.SESI):
-                for r_id, r_info in self.ruangan_dict.items():
-                    if r_info.get('kapasitas', 0) < n_mhs: continue
-                    if h not in r_info.get('tersedia_hari_list', self.HARI): continue
-                    if s not in r_info.get('tersedia_sesi_list', self.SESI): continue
-                    if (h, s, r_id) in used or (h, s, matkul['kelas']) in used or (h, s, matkul['dosen']) in used:
-                        continue
-                    valid.append((h, s, r_id))
-        return valid
+        self.problem = CompiledProblem.from_scheduler(self)
+        self._build_slot_index()
+
+    def _build_slot_index(self):
+        # Slot t = indeks_hari * len(SESI) + indeks_sesi; preferensi dosen dan ketersediaan
+        # ruang disimpan sebagai bitset slot yang diizinkan.
+        p = self.problem
+        n_sesi = len(self.SESI)
+        self._n_slots = len(self.HARI) * n_sesi
+        full = self._full_mask = (1 << self._n_slots) - 1
+
+        def mask(hari_row, sesi_row):
+            bits = 0
+            for i in np.flatnonzero(hari_row):
+                for j in np.flatnonzero(sesi_row):
+                    bits |= 1 << (int(i) * n_sesi + int(j))
+            return bits
+
+        # Dosen yang tidak terdaftar boleh di semua slot (sama seperti default HARI/SESI sebelumnya)
+        self._dosen_mask = [mask(p.pref_hari[i], p.pref_sesi[i]) if d in self.dosen_dict else full
+                            for i, d in enumerate(p.dosen)]
+        room_mask = [mask(p.avail_hari[i], p.avail_sesi[i]) for i in range(len(p.rooms))]
+        # Transpos: per slot, bitset ruang yang tersedia pada slot tersebut
+        self._slot_rooms = [sum(1 << r for r, m in enumerate(room_mask) if m >> t & 1)
+                            for t in range(self._n_slots)]
+
+        self._course_dosen = p.course_dosen.tolist()
+        self._course_kelas = p.course_kelas.tolist()
+        rooms_by_size = {}
+        self._course_rooms = []
+        for n_mhs in p.course_size.tolist():
+            if n_mhs not in rooms_by_size:
+                rooms_by_size[n_mhs] = sum(1 << int(r) for r in np.flatnonzero(~(p.room_capacity < n_mhs)))
+            self._course_rooms.append(rooms_by_size[n_mhs])
+
+    def _new_grid(self):
+        p = self.problem
+        return OccupancyGrid(self._n_slots, len(p.rooms), len(p.dosen), len(p.kelas))
+
+    def _slots(self, genome):
+        return genome[:, GENE_HARI] * len(self.SESI) + genome[:, GENE_SESI]
+
+    def _conflict_index(self, sched: Schedule):
+        index = ConflictIndex(self._new_grid())
+        courses = sched.genome[:, GENE_COURSE].tolist()
+        slots, rooms = self._slots(sched.genome).tolist(), sched.genome[:, GENE_ROOM].tolist()
+        for pos, idx in enumerate(courses):
+            index.add(pos, slots[pos], rooms[pos], self._course_dosen[idx], self._course_kelas[idx])
+        return index
+
+    def _set_gene(self, genome, pos, slot, room):
+        h, s = divmod(slot, len(self.SESI))
+        genome[pos, GENE_HARI:] = (h, s, room)
+
+    def _slot_options(self, course, grid=None, ignore_preference=False):
+        # Per slot yang diizinkan: bitset ruang berkapasitas cukup, tersedia dan (jika grid
+        # diberikan) belum terisi; slot tempat dosen/kelas sudah mengajar dilewati.
+        # ignore_preference: semua slot grid boleh dipakai, bukan hanya preferensi dosen.
+        d, k = self._course_dosen[course], self._course_kelas[course]
+        allowed = self._full_mask if ignore_preference else self._dosen_mask[d]
+        if grid is not None:
+            allowed &= grid.free(dosen=d, kelas=k)
+        rooms_ok = self._course_rooms[course]
+        for t in iter_bits(allowed):
+            rooms = rooms_ok & self._slot_rooms[t]
+            if grid is not None:
+                rooms &= ~grid.rooms_busy(t)
+            if rooms:
+                yield t, rooms
+
+    def _random_valid_slot(self, course, grid=None, ignore_preference=False):
+        # Pilih satu (slot, ruang) secara seragam dari semua pasangan di _slot_options, tanpa
+        # membangun daftar pasangan: bobot tiap slot = jumlah ruang kosongnya
+        options = [(t, rooms, bin(rooms).count("1"))
+                   for t, rooms in self._slot_options(course, grid, ignore_preference)]
+        total = sum(n for _, _, n in options)
+        if not total:
+            return None
+        pick = random.randrange(total)
+        for t, rooms, n in options:
+            if pick < n:
+                return t, next(islice(iter_bits(rooms), pick, None))
+            pick -= n
 
     def generate_population(self) -> List[Schedule]:
         population = []
+        n_courses, n_rooms = len(self.matkul_df), len(self.problem.rooms)
         for _ in range(self.population_size):
-            assignments = []
-            used = set()
-            for idx, matkul in self.matkul_df.iterrows():
-                slot = self._get_valid_slots(matkul, used)
+            slots, rooms = [], []
+            grid = self._new_grid()
+            for idx in range(n_courses):
+                slot = self._random_valid_slot(idx, grid)
                 if slot:
-                    h, s, r = random.choice(slot)
+                    t, r = slot
                 else:
-                    h, s = random.choice(self.HARI), random.choice(self.SESI)
-                    r = random.choice(list(self.ruangan_dict))
-                assignments.append((idx, h, s, r))
-                used.update({(h, s, r), (h, s, matkul['kelas']), (h, s, matkul['dosen'])})
-            sched = Schedule(assignments)
-            sched.fitness = self.fitness(sched)
-            population.append(sched)
+                    t, r = random.randrange(self._n_slots), random.randrange(n_rooms)
+                slots.append(t)
+                rooms.append(r)
+                grid.occupy(t, r, self._course_dosen[idx], self._course_kelas[idx])
+            genome = np.empty((n_courses, 4), dtype=np.int32)
+            genome[:, GENE_COURSE] = np.arange(n_courses)
+            genome[:, GENE_HARI], genome[:, GENE_SESI] = np.divmod(slots, len(self.SESI))
+            genome[:, GENE_ROOM] = rooms
+            population.append(Schedule(genome))
+        self.evaluate(population)
         return population
 
     def fitness(self, sched: Schedule):
+        # Versi per gen dari score_genomes; dipakai sebagai acuan kebenaran kernel numpy
         score = 1000
         penalty, bonus = 0, 0
-        used = set()
-        for idx, h, s, r in sched.assignments:
-            m = self.matkul_df.iloc[idx]
-            d, k = m['dosen'], m['kelas']
-            if (h, s, r) in used: penalty += 100
-            if (h, s, d) in used: penalty += 100
-            if (h, s, k) in used: penalty += 100
-            used.update({(h, s, r), (h, s, d), (h, s, k)})
-            d_info = self.dosen_dict.get(d, {})
-            if h in d_info.get("preferensi_hari_list", []): bonus += 5
-            if s in d_info.get("preferensi_sesi_list", []): bonus += 5
-            if h not in self.ruangan_dict.get(r, {}).get("tersedia_hari_list", []): penalty += 10
-            if s not in self.ruangan_dict.get(r, {}).get("tersedia_sesi_list", []): penalty += 10
+        p = self.problem
+        n_sesi = len(self.SESI)
+        grid = self._new_grid()
+        for idx, hi, si, ri in sched.genome.tolist():
+            t = hi * n_sesi + si
+            d, k = self._course_dosen[idx], self._course_kelas[idx]
+            penalty += 100 * grid.occupy(t, ri, d, k)
+            if p.pref_hari[d, hi]: bonus += 5
+            if p.pref_sesi[d, si]: bonus += 5
+            if not p.avail_hari[ri, hi]: penalty += 10
+            if not p.avail_sesi[ri, si]: penalty += 10
         return max(score + bonus - penalty, 0)
 
-    def evolve(self) -> Schedule:
-        pop = self.generate_population()
-        best = max(pop, key=lambda x: x.fitness)
-        for gen in range(self.generations):
-            selected = [max(random.sample(pop, 5), key=lambda x: x.fitness) for _ in range(len(pop))]
-            children = pop[:self.elite_size]
-            while len(children) < self.population_size:
-                p1, p2 = random.sample(selected, 2)
-                c1, c2 = self.crossover(p1, p2)
-                children.extend([self.mutate(c1), self.mutate(c2)])
-            pop = children[:self.population_size]
-            current = max(pop, key=lambda x: x.fitness)
-            if current.fitness > best.fitness:
-                best = current
+    def evaluate(self, population: List[Schedule]):
+        # Fitness dihitung per generasi sekaligus lewat kernel numpy (score_genomes);
+        # dengan workers > 1 genome disalin langsung ke shared memory dan dinilai paralel.
+        if not population:
+            return population
+        genomes = [sched.genome for sched in population]
+        if self._evaluator is not None:
+            scores = self._evaluator.evaluate(genomes)
+        else:
+            scores = score_genomes(np.stack(genomes), self.problem.arrays())
+        for sched, score in zip(population, scores):
+            sched.fitness = float(score)
+        return population
+
+    @contextmanager
+    def _evaluation_backend(self):
+        if self.workers <= 1:
+            yield
+            return
+        self._evaluator = SharedMemoryEvaluator(self.problem, self.population_size + 1,
+                                                len(self.matkul_df), self.workers)
+        try:
+            yield
+        finally:
+            self._evaluator.close()
+            self._evaluator = None
+
+    def _save_checkpoint(self, path, generation, pop, best):
+        save_checkpoint(path, Checkpoint(
+            generation=generation,
+            genomes=np.stack([x.genome for x in pop]),
+            fitness=np.array([x.fitness for x in pop]),
+            best_genome=best.genome,
+            best_fitness=best.fitness,
+            rng_state=random.getstate(),
+            fingerprint=self.problem.fingerprint(),
+            params=self._resume_params(),
+        ))
+
+    def _resume_params(self):
+        return {name: getattr(self, name) for name in self.RESUME_PARAMS}
+
+    def _load_checkpoint(self, path):
+        ckpt = load_checkpoint(path)
+        if ckpt.fingerprint != self.problem.fingerprint():
+            raise ValueError("Checkpoint dibuat dari data yang berbeda, tidak dapat dilanjutkan")
+        current = self._resume_params()
+        changed = [f"{name} {ckpt.params.get(name)} -> {value}" for name, value in current.items()
+                   if ckpt.params.get(name) != value]
+        if changed:
+            raise ValueError("Parameter GA berbeda dari checkpoint (" + "; ".join(changed) + "). "
+                             "Samakan parameter untuk melanjutkan, atau mulai run baru.")
+        pop = [Schedule(g, float(f)) for g, f in zip(ckpt.genomes, ckpt.fitness)]
+        best = Schedule(ckpt.best_genome, ckpt.best_fitness)
+        random.setstate(ckpt.rng_state)
+        return ckpt.generation, pop, best
+
+    def evolve(self, checkpoint_path=None, checkpoint_every=25, resume=False) -> Schedule:
+        # Dengan checkpoint_path, status GA (populasi, fitness, terbaik, state RNG, generasi)
+        # disimpan setiap checkpoint_every generasi dan di akhir. resume=True melanjutkan dari
+        # checkpoint tersebut sampai self.generations total; menaikkan generations berarti
+        # melanjutkan run yang sudah selesai.
+        # Setiap repair_every generasi, repair_top individu terbaik diperbaiki lokal (memetic).
+        with self._evaluation_backend():
+            if resume and checkpoint_path and Path(checkpoint_path).exists():
+                start, pop, best = self._load_checkpoint(checkpoint_path)
+            else:
+                start, pop = 0, self.generate_population()
+                best = max(pop, key=lambda x: x.fitness)
+            for gen in range(start, self.generations):
+                selected = [max(random.sample(pop, 5), key=lambda x: x.fitness) for _ in range(len(pop))]
+                children = pop[:self.elite_size]
+                while len(children) < self.population_size:
+                    p1, p2 = random.sample(selected, 2)
+                    c1, c2 = self.crossover(p1, p2)
+                    children.extend([self.mutate(c1), self.mutate(c2)])
+                pop = children[:self.population_size]
+                # Anak yang identik dengan induknya (tanpa crossover/mutasi) tidak dinilai ulang
+                self.evaluate([x for x in pop[self.elite_size:] if x.fitness is None])
+                if self.repair_every and (gen + 1) % self.repair_every == 0:
+                    self._repair_top(pop)
+                current = max(pop, key=lambda x: x.fitness)
+                if current.fitness > best.fitness:
+                    best = current
+                if checkpoint_path and (gen + 1) % checkpoint_every == 0:
+                    self._save_checkpoint(checkpoint_path, gen + 1, pop, best)
+            if checkpoint_path:
+                self._save_checkpoint(checkpoint_path, max(start, self.generations), pop, best)
+            # Hasil akhir selalu diperbaiki; cek kelayakan lewat is_feasible()
+            best = self.evaluate([self.repair(best)])[0]
         return best
 
     def crossover(self, p1: Schedule, p2: Schedule):
         if random.random() > self.crossover_rate:
             return p1, p2
-        size = len(p1.assignments)
+        size = len(p1.genome)
         s, e = sorted(random.sample(range(size), 2))
         def make_child(a, b):
-            child = [None]*size
+            # Baris genome = indeks mata kuliah, jadi potongan a cukup ditimpa ke salinan b
+            child = b.copy()
             child[s:e] = a[s:e]
-            idx = 0
-            for i in range(size):
-                while idx < size and any(b[idx][0] == x[0] for x in child if x): idx += 1
-                if child[i] is None and idx < size: child[i] = b[idx]; idx += 1
             return Schedule(child)
-        c1, c2 = make_child(p1.assignments, p2.assignments), make_child(p2.assignments, p1.assignments)
-        c1.fitness, c2.fitness = self.fitness(c1), self.fitness(c2)
-        return c1, c2
+        return make_child(p1.genome, p2.genome), make_child(p2.genome, p1.genome)
 
     def mutate(self, sched: Schedule):
         if random.random() > self.mutation_rate:
             return sched
-        m = Schedule(sched.assignments.copy())
-        i = random.randint(0, len(m.assignments) - 1)
-        matkul = self.matkul_df.iloc[m.assignments[i][0]]
-        slot = self._get_valid_slots(matkul, set())
+        # Mutasi terarah: utamakan gen yang bentrok, lalu pindahkan ke slot yang benar-benar
+        # kosong pada jadwal ini (preferensi dosen dulu, slot lain jika tidak ada).
+        # Bentrok dan hunian dihitung vektor dari genome, tanpa ConflictIndex per gen.
+        m = Schedule(sched.genome.copy())
+        p = self.problem
+        slots, rooms = self._slots(m.genome), m.genome[:, GENE_ROOM]
+        courses = m.genome[:, GENE_COURSE]
+        dosen, kelas = p.course_dosen[courses], p.course_kelas[courses]
+        n_rooms, n_dosen, n_kelas = len(p.rooms), len(p.dosen), len(p.kelas)
+        conflicted = shared_cells(slots * n_rooms + rooms, slots * n_dosen + dosen, slots * n_kelas + kelas)
+        if conflicted.any() and random.random() < self.conflict_bias:
+            i = random.choice(np.flatnonzero(conflicted).tolist())
+        else:
+            i = random.randrange(len(m.genome))
+        course = int(courses[i])
+        view = OccupancyView(self._n_slots, n_rooms, slots, rooms, dosen, kelas, skip=i)
+        slot = self._random_valid_slot(course, view)
+        if slot is None and conflicted[i]:
+            slot = self._random_valid_slot(course, view, ignore_preference=True)
+        if slot:
+            self._set_gene(m.genome, i, *slot)
+        return m
+
+    def _placement_ok(self, course, slot, room):
+        # Ruang tersedia pada slot tersebut dan kapasitasnya cukup untuk kelas
+        return bool(self._slot_rooms[slot] >> room & 1 and self._course_rooms[course] >> room & 1)
+
+    def _violations(self, sched: Schedule, index: ConflictIndex):
+        # Posisi gen yang melanggar hard constraint: bentrok, ruang tidak tersedia atau terlalu kecil
+        bad = set(index.conflicted)
+        courses = sched.genome[:, GENE_COURSE].tolist()
+        for pos, (t, r, _, _) in index.genes.items():
+            if not self._placement_ok(courses[pos], t, r):
+                bad.add(pos)
+        return bad
+
+    def violations(self, sched: Schedule) -> int:
+        """Jumlah gen yang melanggar hard constraint; 0 berarti jadwal layak."""
+        return len(self._violations(sched, self._conflict_index(sched)))
+
+    def is_feasible(self, sched: Schedule) -> bool:
+        return self.violations(sched) == 0
+
+    def _place(self, sched, index, pos, slot, room):
+        course = int(sched.genome[pos, GENE_COURSE])
+        index.add(pos, slot, room, self._course_dosen[course], self._course_kelas[course])
+        self._set_gene(sched.genome, pos, slot, room)
+
+    def _relocate(self, sched, index, pos, depth, chain):
+        # Rantai pindah (ejection chain, gaya Kempe): gen pos dilepas lalu dicari tempat kosong
+        # yang sah; jika tidak ada, gen menempati sel yang hanya diblokir satu gen lain, dan gen
+        # itu dipindah secara rekursif dengan kedalaman berkurang. Rantai kedalaman 2 yang
+        # berakhir di sel asal sama dengan tukar (swap). Gagal -> semua langkah dibatalkan.
+        course = int(sched.genome[pos, GENE_COURSE])
+        origin = index.remove(pos)
+        slot = self._random_valid_slot(course, index.grid) \
+            or self._random_valid_slot(course, index.grid, ignore_preference=True)
         if slot:
-            h, s, r = random.choice(slot)
-            m.assignments[i] = (m.assignments[i][0], h, s, r)
-            m.fitness = self.fitness(m)
+            self._place(sched, index, pos, *slot)
+            return True
+        if depth > 1:
+            d, k = self._course_dosen[course], self._course_kelas[course]
+            candidates = [(t, r) for t, rooms in self._slot_options(course, ignore_preference=True)
+                          for r in iter_bits(rooms)]
+            random.shuffle(candidates)
+            tried = 0
+            for t, r in candidates:
+                blockers = index.blockers(t, r, d, k)
+                if len(blockers) != 1:
+                    continue
+                (other,) = blockers
+                if other in chain:
+                    continue
+                self._place(sched, index, pos, t, r)
+                if self._relocate(sched, index, other, depth - 1, chain | {other}):
+                    return True
+                index.remove(pos)
+                tried += 1
+                if tried >= self.REPAIR_WIDTH:
+                    break
+        self._place(sched, index, pos, origin[0], origin[1])
+        return False
+
+    def repair(self, sched: Schedule, max_depth=None) -> Schedule:
+        """Perbaikan lokal (memetic): hilangkan pelanggaran hard constraint yang tersisa.
+
+        Setiap gen yang melanggar dipindah lewat rantai pindah/tukar berkedalaman paling
+        banyak max_depth; gen lain hanya digeser ke tempat yang tetap sah, sehingga jumlah
+        pelanggaran tidak pernah bertambah. Mengembalikan Schedule baru (fitness belum dihitung).
+        max_depth=None memakai repair_depth; max_depth=0 tidak memindah gen apa pun.
+        """
+        if max_depth is None:
+            max_depth = self.repair_depth
+        m = Schedule(sched.genome.copy())
+        if max_depth < 1:
+            return m
+        index = self._conflict_index(m)
+        bad = self._violations(m, index)
+        while bad:
+            fixed = False
+            for pos in sorted(bad):
+                if pos in index.conflicted or not self._placement_ok(int(m.genome[pos, GENE_COURSE]), *index.genes[pos][:2]):
+                    fixed |= self._relocate(m, index, pos, max_depth, {pos})
+            remaining = self._violations(m, index)
+            if not fixed or len(remaining) >= len(bad):
+                break
+            bad = remaining
         return m
 
+    def _repair_top(self, pop):
+        # Perbaiki individu terbaik langsung di populasi, lalu nilai ulang
+        top = sorted(range(len(pop)), key=lambda i: pop[i].fitness, reverse=True)[:self.repair_top]
+        for i in top:
+            pop[i] = self.repair(pop[i])
+        self.evaluate([pop[i] for i in top])
+
     def to_dataframe(self, sched: Schedule) -> pd.DataFrame:
-        rows = []
-        for idx, h, s, r in sched.assignments:
-            m = self.matkul_df.iloc[idx]
-            rows.append({
-                "hari": h, "sesi": s,
-                "kode_matkul": m['kode_matkul'],
-                "nama_matkul": m['nama_matkul'],
-                "kelas": m['kelas'],
-                "dosen": m['dosen'],
-                "ruangan": r
-            })
-        return pd.DataFrame(rows)
+        g = sched.genome
+        m = self.matkul_df.iloc[g[:, GENE_COURSE]]
+        return pd.DataFrame({
+            "hari": np.array(self.HARI, dtype=object)[g[:, GENE_HARI]],
+            "sesi": np.array(self.SESI)[g[:, GENE_SESI]],
+            "kode_matkul": m['kode_matkul'].to_numpy(),
+            "nama_matkul": m['nama_matkul'].to_numpy(),
+            "kelas": m['kelas'].to_numpy(),
+            "dosen": m['dosen'].to_numpy(),
+            "ruangan": np.array(self.problem.rooms, dtype=object)[g[:, GENE_ROOM]]
+        })
 
 def jadwalkan_ai(matkul, dosen, kelas, ruangan, **kwargs):
     ai = AIScheduler(
@@ -178,7 +476,14 @@ def jadwalkan_ai(matkul, dosen, kelas, ruangan, **kwargs):
         ruangan,
         population_size=kwargs.get('population_size', 100),
         generations=kwargs.get('generations', 300),
-        mutation_rate=kwargs.get('mutation_rate', 0.1)
+        mutation_rate=kwargs.get('mutation_rate', 0.1),
+        workers=kwargs.get('workers', 1),
+        repair_every=kwargs.get('repair_every', 10),
+        hari=kwargs.get('hari'),
+        sesi=kwargs.get('sesi')
+    )
+    best = ai.evolve(
+        checkpoint_path=kwargs.get('checkpoint_path'),
+        resume=kwargs.get('resume', False)
     )
-    best = ai.evolve()
     return ai.to_dataframe(best)
\ No newline at end of file
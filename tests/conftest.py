@@ -0,0 +1,45 @@
+# tests/conftest.py
+import random
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Modul aplikasi berada langsung di root repo (tanpa paket)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scheduler import AIScheduler  # noqa: E402
+
+HARI = ["Senin", "Selasa", "Rabu", "Kamis", "Jumat"]
+
+def _make_scheduler(n_matkul=40, seed=0, **params):
+    # Data kecil yang sengaja sesak: bentrok, ruang tidak tersedia, dosen tanpa data preferensi
+    rng = random.Random(seed)
+    dosen = pd.DataFrame({
+        "kode_dosen": [f"D{i}" for i in range(6)],
+        "nama_dosen": "x",
+        "preferensi_hari": [",".join(rng.sample(HARI, 2)) for _ in range(6)],
+        "preferensi_sesi": [",".join(map(str, rng.sample(range(1, 6), 2))) for _ in range(6)],
+    })
+    kelas = pd.DataFrame({"kode_kelas": [f"K{i}" for i in range(5)],
+                          "jumlah_mahasiswa": [rng.randint(20, 60) for _ in range(5)]})
+    ruangan = pd.DataFrame({
+        "kode_ruang": [f"R{i}" for i in range(4)],
+        "kapasitas": [rng.randint(30, 70) for _ in range(4)],
+        "tersedia_hari": [",".join(rng.sample(HARI, 3)) for _ in range(4)],
+        "tersedia_sesi": ["1,2,3", "2,3,4", "1,5", "1,2,3,4,5"],
+    })
+    matkul = pd.DataFrame({
+        "kode_matkul": [f"M{i}" for i in range(n_matkul)],
+        "nama_matkul": "m",
+        "sks": 3,
+        "kelas": [f"K{rng.randrange(5)}" for _ in range(n_matkul)],
+        "dosen": [f"D{rng.randrange(7)}" for _ in range(n_matkul)],  # D6 tidak ada di dosen.csv
+    })
+    params.setdefault("population_size", 20)
+    return AIScheduler(matkul, dosen, kelas, ruangan, **params)
+
+@pytest.fixture
+def make_scheduler():
+    return _make_scheduler
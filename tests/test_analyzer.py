@@ -0,0 +1,20 @@
+# tests/test_analyzer.py
+import warnings
+
+from analyzer import analyze_schedule
+
+def test_utilization_lists_every_room(make_scheduler):
+    ai = make_scheduler()
+    jadwal = ai.to_dataframe(ai.generate_population()[0])
+    jadwal["ruangan"] = "R0"  # R1-R3 tidak terpakai
+    jadwal.loc[0, "ruangan"] = "R9"  # ruangan yang tidak terdaftar di ruangan.csv
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        report = analyze_schedule(jadwal, ai.dosen_df, ai.kelas_df, ai.ruangan_df)
+
+    assert list(report.utilization.index) == ["R0", "R1", "R2", "R3", "R9"]
+    assert (report.utilization.loc[["R1", "R2", "R3"]] == 0).all().all()
+    assert int(report.utilization.to_numpy().sum()) == len(jadwal)
+    assert report.utilization.shape[1] == len(ai.HARI) * len(ai.SESI)
+    assert set(report.clashes["kode"]) >= {"R0"}
@@ -0,0 +1,34 @@
+# tests/test_checkpoint.py
+import random
+
+import pytest
+
+def run(ai, path, resume=False):
+    return ai.evolve(checkpoint_path=path, checkpoint_every=4, resume=resume)
+
+def test_resume_continues_the_same_run(make_scheduler, tmp_path):
+    random.seed(3)
+    full = run(make_scheduler(generations=12), tmp_path / "full.npz")
+
+    random.seed(3)
+    run(make_scheduler(generations=8), tmp_path / "part.npz")
+    random.seed(99)  # state RNG harus dipulihkan dari checkpoint
+    resumed = run(make_scheduler(generations=12), tmp_path / "part.npz", resume=True)
+
+    assert (resumed.genome == full.genome).all()
+    assert resumed.fitness == full.fitness
+
+def test_resume_refuses_different_ga_params(make_scheduler, tmp_path):
+    path = tmp_path / "ckpt.npz"
+    run(make_scheduler(generations=4), path)
+    with pytest.raises(ValueError, match="mutation_rate"):
+        run(make_scheduler(generations=8, mutation_rate=0.3), path, resume=True)
+
+def test_resume_refuses_changed_room_capacity(make_scheduler, tmp_path):
+    path = tmp_path / "ckpt.npz"
+    run(make_scheduler(generations=4), path)
+    ai = make_scheduler(generations=8)
+    ai.ruangan_df.loc[0, "kapasitas"] += 1
+    ai._preprocess()
+    with pytest.raises(ValueError, match="data yang berbeda"):
+        run(ai, path, resume=True)
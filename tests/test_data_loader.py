@@ -0,0 +1,60 @@
+# tests/test_data_loader.py
+import io
+
+import pytest
+
+import data_loader
+from data_loader import ingest_csv
+
+DOSEN = "kode_dosen,nama_dosen,preferensi_hari,preferensi_sesi\nD1,A,Senin,1\nD2,B,Selasa,2\n"
+KELAS = "kode_kelas,jumlah_mahasiswa\nK1,30\nK2,40\n"
+MATKUL_HEADER = "kode_matkul,nama_matkul,sks,kelas,dosen\n"
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_loader, "DATA_DIR", tmp_path)
+    return tmp_path
+
+def upload(text, file_name, **kwargs):
+    return ingest_csv(io.StringIO(text), file_name, **kwargs)
+
+def test_duplicate_keys_across_chunks(data_dir):
+    rows = "".join(f"D{i},x,,\n" for i in range(5)) + "D1,y,,\n"
+    result = upload("kode_dosen,nama_dosen,preferensi_hari,preferensi_sesi\n" + rows, "dosen.csv", chunksize=2)
+    assert result.errors == ["1 kode_dosen duplikat: D1"]
+
+def test_errors_report_csv_line_numbers(data_dir):
+    # Baris 2 = baris data pertama; baris 5 dan 7 berada di chunk yang berbeda
+    rows = ["K1,30", "K2,40", "K3,40", "K4,nol", "K5,10", "K6,-3"]
+    result = upload("kode_kelas,jumlah_mahasiswa\n" + "\n".join(rows) + "\n", "kelas.csv", chunksize=2)
+    assert result.errors == ["baris 5, 7: kolom jumlah_mahasiswa harus bilangan bulat positif (2 baris)"]
+
+@pytest.mark.parametrize("col, ref, row", [
+    ("dosen", "dosen.csv", "M1,m,3,K1,D9"),
+    ("kelas", "kelas.csv", "M1,m,3,K9,D1"),
+])
+def test_matkul_with_unknown_reference_is_rejected(data_dir, col, ref, row):
+    (data_dir / "dosen.csv").write_text(DOSEN)
+    (data_dir / "kelas.csv").write_text(KELAS)
+    result = upload(MATKUL_HEADER + row + "\n", "matkul.csv")
+    assert not result.ok
+    assert result.errors[0].startswith(f"1 kode {col} di matkul.csv tidak ditemukan di {ref}: ")
+    assert not (data_dir / "matkul.csv").exists()
+
+@pytest.mark.parametrize("file_name, text", [
+    ("dosen.csv", "kode_dosen,nama_dosen,preferensi_hari,preferensi_sesi\nD2,B,,\n"),
+    ("kelas.csv", "kode_kelas,jumlah_mahasiswa\nK2,40\n"),
+])
+def test_replacing_referenced_file_only_warns(data_dir, file_name, text):
+    (data_dir / "matkul.csv").write_text(MATKUL_HEADER + "M1,m,3,K1,D1\n")
+    result = upload(text, file_name)
+    assert result.ok
+    assert len(result.warnings) == 1 and "matkul.csv" in result.warnings[0]
+    assert (data_dir / file_name).read_text().splitlines()[1:] == text.splitlines()[1:]
+
+def test_rejected_upload_keeps_existing_file(data_dir):
+    (data_dir / "dosen.csv").write_text(DOSEN)
+    result = upload("kode_dosen,nama_dosen,preferensi_hari,preferensi_sesi\nD1,,Minggu,1\n", "dosen.csv")
+    assert not result.ok
+    assert (data_dir / "dosen.csv").read_text() == DOSEN
+    assert list(data_dir.iterdir()) == [data_dir / "dosen.csv"]
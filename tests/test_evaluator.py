@@ -0,0 +1,39 @@
+# tests/test_evaluator.py
+import random
+
+import numpy as np
+import pytest
+
+from evaluator import GENE_COURSE, SharedMemoryEvaluator, score_genomes
+from scheduler import Schedule
+
+def random_population(ai, n, seed=1):
+    rng = np.random.default_rng(seed)
+    n_matkul = len(ai.matkul_df)
+    population = []
+    for _ in range(n):
+        genome = np.empty((n_matkul, 4), dtype=np.int32)
+        genome[:, GENE_COURSE] = np.arange(n_matkul)
+        genome[:, 1] = rng.integers(0, len(ai.HARI), n_matkul)
+        genome[:, 2] = rng.integers(0, len(ai.SESI), n_matkul)
+        genome[:, 3] = rng.integers(0, len(ai.problem.rooms), n_matkul)
+        population.append(Schedule(genome))
+    return population
+
+@pytest.mark.parametrize("n_matkul", [12, 40])
+def test_score_genomes_matches_fitness(make_scheduler, n_matkul):
+    ai = make_scheduler(n_matkul)
+    random.seed(0)
+    population = ai.generate_population() + random_population(ai, 20)
+    scores = score_genomes(np.stack([s.genome for s in population]), ai.problem.arrays())
+    assert scores.tolist() == [ai.fitness(s) for s in population]
+    # Harus ada kasus yang tidak terpotong di 0, agar penalti dan bonus benar-benar teruji
+    assert len(set(scores.tolist()) - {0.0}) > 1
+
+def test_shared_memory_evaluator_matches_score_genomes(make_scheduler):
+    ai = make_scheduler()
+    population = random_population(ai, 25)
+    genomes = [s.genome for s in population]
+    expected = score_genomes(np.stack(genomes), ai.problem.arrays())
+    with SharedMemoryEvaluator(ai.problem, capacity=10, n_genes=len(ai.matkul_df), workers=2) as evaluator:
+        assert evaluator.evaluate(genomes).tolist() == expected.tolist()
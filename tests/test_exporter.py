@@ -0,0 +1,95 @@
+# tests/test_exporter.py
+import csv
+import io
+import zipfile
+from datetime import date
+
+import pandas as pd
+import pytest
+
+import exporter
+from exporter import ICS_LINE_OCTETS, _fold_line, write_bulk_export
+
+def make_jadwal(dosen, **columns):
+    n = len(dosen)
+    data = {"hari": ["Senin", "Selasa", "Rabu", "Kamis", "Jumat"] * n, "sesi": [1, 2, 3, 4, 5] * n}
+    data = {k: v[:n] for k, v in data.items()}
+    data.update(kode_matkul=[f"M{i}" for i in range(n)], nama_matkul="Kalkulus",
+                kelas=[f"K{i % 2}" for i in range(n)], dosen=dosen, ruangan="R1")
+    data.update(columns)
+    return pd.DataFrame(data)
+
+def export(jadwal):
+    buf = io.BytesIO()
+    write_bulk_export(jadwal, buf, date(2026, 9, 7), weeks=2)
+    zf = zipfile.ZipFile(buf)
+    return zf, {name: zf.read(name).decode("utf-8") for name in zf.namelist()}
+
+def csv_rows(text):
+    return list(csv.DictReader(io.StringIO(text)))
+
+def test_one_csv_and_ics_per_entity():
+    jadwal = make_jadwal(["D1", "D2", "D1", "D3", "D1"])
+    _, files = export(jadwal)
+    assert sorted(n for n in files if n.startswith("dosen/")) == [
+        "dosen/D1.csv", "dosen/D1.ics", "dosen/D2.csv", "dosen/D2.ics", "dosen/D3.csv", "dosen/D3.ics"]
+    assert sorted(n for n in files if n.startswith("kelas/")) == [
+        "kelas/K0.csv", "kelas/K0.ics", "kelas/K1.csv", "kelas/K1.ics"]
+    for code, count in jadwal["dosen"].value_counts().items():
+        assert len(csv_rows(files[f"dosen/{code}.csv"])) == count
+        assert files[f"dosen/{code}.ics"].count("BEGIN:VEVENT") == count
+    assert len(csv_rows(files["ruangan/R1.csv"])) == len(jadwal)
+
+def test_csv_quotes_commas_and_quotes():
+    names = ["Fisika, Dasar", 'Pemrograman "Lanjut"', "Kalkulus"]
+    _, files = export(make_jadwal(["D1"] * 3, nama_matkul=names))
+    text = files["dosen/D1.csv"]
+    assert '"Fisika, Dasar"' in text and '"Pemrograman ""Lanjut"""' in text
+    assert [row["nama_matkul"] for row in csv_rows(text)] == names
+
+def test_entity_spanning_chunks_is_one_entry(monkeypatch):
+    monkeypatch.setattr(exporter, "CHUNK_ROWS", 3)
+    jadwal = make_jadwal(["D1"] * 5 + ["D2"] * 3)
+    zf, files = export(jadwal)
+    assert len(zf.namelist()) == len(set(zf.namelist()))
+    assert [row["kode_matkul"] for row in csv_rows(files["dosen/D1.csv"])] == [f"M{i}" for i in range(5)]
+    ics = files["dosen/D1.ics"]
+    assert ics.count("BEGIN:VCALENDAR") == 1 and ics.count("BEGIN:VEVENT") == 5
+    assert ics.endswith("END:VCALENDAR\r\n")
+
+def test_colliding_entity_names_stay_separate():
+    codes = ["X", "X 2", "X*", "x"]
+    zf, files = export(make_jadwal(codes))
+    names = [n for n in zf.namelist() if n.startswith("dosen/") and n.endswith(".csv")]
+    assert len(names) == len({n.lower() for n in names}) == len(codes)
+    assert sorted(csv_rows(files[n])[0]["dosen"] for n in names) == sorted(codes)
+
+def unfold(text):
+    return text.replace("\r\n ", "")
+
+@pytest.mark.parametrize("line", [
+    "DESCRIPTION:" + "x" * 200,
+    "SUMMARY:" + "a" * 66 + "é" * 40,      # karakter 2 oktet tepat di batas lipatan
+    "LOCATION:" + "日本語" * 30,            # karakter 3 oktet
+])
+def test_fold_line_keeps_utf8_and_octet_limit(line):
+    folded = _fold_line(line)
+    parts = folded.split("\r\n")
+    assert len(parts) > 1
+    assert all(len(p.encode("utf-8")) <= ICS_LINE_OCTETS for p in parts)
+    assert all(p.startswith(" ") for p in parts[1:])
+    assert unfold(folded) == line
+
+def test_fold_point_moves_before_multibyte_character():
+    line = "A" * 74 + "é" + "B" * 10
+    first = _fold_line(line).split("\r\n")[0]
+    assert first == "A" * 74
+
+def test_short_line_is_unchanged():
+    assert _fold_line("SUMMARY:Kalkulus") == "SUMMARY:Kalkulus"
+
+def test_every_ics_line_fits():
+    _, files = export(make_jadwal(["D1"], nama_matkul=["Ékonomi " * 20]))
+    ics = files["dosen/D1.ics"]
+    assert all(len(line.encode("utf-8")) <= ICS_LINE_OCTETS for line in ics.split("\r\n"))
+    assert "SUMMARY:" + "Ékonomi " * 20 in unfold(ics)
@@ -0,0 +1,44 @@
+# tests/test_grid.py
+import io
+import zipfile
+from datetime import date
+
+import pytest
+
+import data_loader
+from analyzer import analyze_schedule
+from data_loader import GRID, TimeGrid, ingest_csv
+from exporter import write_bulk_export
+
+WIDE = TimeGrid(hari=GRID.hari + ("Sabtu",), jam=GRID.jam + (("17:10", "18:50"),))
+
+def test_upload_validation_follows_grid(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_loader, "DATA_DIR", tmp_path)
+    text = "kode_ruang,kapasitas,tersedia_hari,tersedia_sesi\nR1,40,\"Jumat,Sabtu\",\"5,6\"\n"
+
+    rejected = ingest_csv(io.StringIO(text), "ruangan.csv")
+    assert any("hari tidak dikenal" in e for e in rejected.errors)
+    assert any("sesi tidak dikenal" in e for e in rejected.errors)
+
+    assert ingest_csv(io.StringIO(text), "ruangan.csv", grid=WIDE).ok
+
+def test_wide_grid_reaches_schedule_analysis_and_export(make_scheduler):
+    ai = make_scheduler(generations=3).with_params(hari=WIDE.hari, sesi=WIDE.sesi)
+    jadwal = ai.to_dataframe(ai.evolve())
+    assert set(jadwal["hari"]) <= set(WIDE.hari)
+
+    report = analyze_schedule(jadwal, ai.dosen_df, ai.kelas_df, ai.ruangan_df,
+                              hari=list(WIDE.hari), sesi=WIDE.sesi)
+    assert ("Sabtu", 6) in report.utilization.columns
+
+    extra = jadwal.assign(hari="Sabtu", sesi=6)
+    buf = io.BytesIO()
+    write_bulk_export(extra, buf, date(2026, 9, 7), weeks=1, grid=WIDE)
+    with zipfile.ZipFile(buf) as zf:
+        ics = "".join(zf.read(n).decode() for n in zf.namelist() if n.startswith("ruangan/") and n.endswith(".ics"))
+    assert ics.count("BEGIN:VEVENT") == len(extra)
+    assert "DTSTART:20260912T171000" in ics  # Sabtu pertama setelah Senin 7 September 2026
+
+def test_grid_rejects_unknown_day():
+    with pytest.raises(ValueError):
+        TimeGrid(hari=("Senin", "Libur"))
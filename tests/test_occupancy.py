@@ -0,0 +1,30 @@
+# tests/test_occupancy.py
+import numpy as np
+import pytest
+
+from evaluator import GENE_COURSE, GENE_ROOM
+from occupancy import OccupancyView, shared_cells
+from test_evaluator import random_population
+
+@pytest.mark.parametrize("skip", [None, 0, 17])
+def test_vector_view_matches_conflict_index(make_scheduler, skip):
+    ai = make_scheduler()
+    p = ai.problem
+    for sched in random_population(ai, 5):
+        index = ai._conflict_index(sched)
+        slots, rooms = ai._slots(sched.genome), sched.genome[:, GENE_ROOM]
+        courses = sched.genome[:, GENE_COURSE]
+        dosen, kelas = p.course_dosen[courses], p.course_kelas[courses]
+
+        shared = shared_cells(slots * len(p.rooms) + rooms, slots * len(p.dosen) + dosen,
+                              slots * len(p.kelas) + kelas)
+        assert set(np.flatnonzero(shared).tolist()) == index.conflicted
+
+        if skip is not None:
+            index.remove(skip)
+        view = OccupancyView(ai._n_slots, len(p.rooms), slots, rooms, dosen, kelas, skip=skip)
+        for d in range(len(p.dosen)):
+            for k in range(len(p.kelas)):
+                assert view.free(dosen=d, kelas=k) == index.grid.free(dosen=d, kelas=k)
+        for t in range(ai._n_slots):
+            assert view.rooms_busy(t) == index.grid.rooms_busy(t)
@@ -0,0 +1,78 @@
+# tests/test_repair.py
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from scheduler import AIScheduler, Schedule
+from test_evaluator import random_population
+
+def test_repair_depth_zero_moves_nothing(make_scheduler):
+    ai = make_scheduler(repair_depth=3)
+    sched = random_population(ai, 1)[0]
+    assert ai.violations(sched) > 0
+
+    assert (ai.repair(sched, max_depth=0).genome == sched.genome).all()
+
+    random.seed(0)
+    repaired = ai.repair(sched)
+    assert ai.violations(repaired) < ai.violations(sched)
+
+@pytest.mark.parametrize("n_matkul, seed", [(12, 0), (25, 1), (40, 2), (60, 3)])
+def test_repair_never_adds_violations(make_scheduler, n_matkul, seed):
+    ai = make_scheduler(n_matkul=n_matkul, seed=seed)
+    random.seed(seed)
+    for depth in (1, 2, 3):
+        for sched in random_population(ai, 10, seed=seed):
+            assert ai.violations(ai.repair(sched, max_depth=depth)) <= ai.violations(sched)
+
+def test_clash_fixed_by_swap():
+    # Dua slot (Senin 1, 2), empat sel, empat mata kuliah: semua sel terisi, jadi bentrok dosen
+    # D0 di slot 0 hanya bisa diselesaikan dengan menukar dua mata kuliah, bukan memindah satu.
+    dosen = pd.DataFrame({"kode_dosen": ["D0", "D1", "D2"], "nama_dosen": "x",
+                          "preferensi_hari": "Senin", "preferensi_sesi": "1,2"})
+    kelas = pd.DataFrame({"kode_kelas": ["K0", "K1", "K2", "K3"], "jumlah_mahasiswa": [80, 20, 20, 20]})
+    ruangan = pd.DataFrame({"kode_ruang": ["R0", "R1"], "kapasitas": [100, 30],
+                            "tersedia_hari": "Senin", "tersedia_sesi": "1,2"})
+    matkul = pd.DataFrame({"kode_matkul": ["M0", "M1", "M2", "M3"], "nama_matkul": "m", "sks": 3,
+                           "kelas": ["K0", "K1", "K2", "K3"], "dosen": ["D0", "D0", "D1", "D2"]})
+    ai = AIScheduler(matkul, dosen, kelas, ruangan, hari=["Senin"], sesi=[1, 2])
+    # (mata kuliah, hari, sesi, ruang): M0 dan M1 sama-sama diajar D0 di sesi 1
+    sched = Schedule(np.array([[0, 0, 0, 0], [1, 0, 0, 1], [2, 0, 1, 1], [3, 0, 1, 0]], dtype=np.int32))
+    assert ai.violations(sched) == 2
+
+    random.seed(0)
+    assert not ai.is_feasible(ai.repair(sched, max_depth=1))  # memindah satu gen saja tidak cukup
+    repaired = ai.repair(sched)
+    assert ai.is_feasible(repaired)
+    # Tetap satu mata kuliah per sel: hasilnya pertukaran, bukan sel baru
+    cells = {(h, s, r) for _, h, s, r in repaired.genome.tolist()}
+    assert len(cells) == 4
+
+@pytest.mark.parametrize("generations, expected", [(2, 0), (3, 1), (7, 2)])
+def test_evolve_repairs_top_every_repair_every(make_scheduler, monkeypatch, generations, expected):
+    ai = make_scheduler(generations=generations, repair_every=3, repair_top=2)
+    repaired, rounds = [], []
+    repair = ai.repair
+
+    def spy_repair(sched, max_depth=None):
+        repaired.append(sched)
+        return repair(sched, max_depth)
+
+    repair_top = ai._repair_top
+
+    def spy_repair_top(pop):
+        top = sorted(pop, key=lambda x: x.fitness, reverse=True)[:ai.repair_top]
+        start = len(repaired)
+        repair_top(pop)
+        assert [id(x) for x in repaired[start:]] == [id(x) for x in top]
+        assert all(x.fitness is not None for x in pop)
+        rounds.append(len(repaired[start:]))
+
+    monkeypatch.setattr(ai, "repair", spy_repair)
+    monkeypatch.setattr(ai, "_repair_top", spy_repair_top)
+    random.seed(0)
+    ai.evolve()
+    assert rounds == [ai.repair_top] * expected
+    assert len(repaired) == ai.repair_top * expected + 1  # plus perbaikan hasil akhir